@@ -0,0 +1,36 @@
+"""
+Subprocess helpers shared by the dmm-* command line tools.
+
+CPython only takes the posix_spawn fast path (instead of fork+exec) when the
+executable has a directory component and close_fds is False. Both
+preconditions are applied here so every tool gets them the same way; leaving
+close_fds off is safe because Python-created descriptors are non-inheritable
+by default.
+"""
+from __future__ import annotations
+
+import shutil
+import subprocess
+from functools import lru_cache
+from typing import Any, List, Sequence
+
+
+@lru_cache(maxsize=None)
+def resolve_executable(name: str) -> str:
+    """Return the absolute path of an executable, or the name unchanged if not found"""
+    return shutil.which(name) or name
+
+
+def spawn_argv(cmd: Sequence[str]) -> List[str]:
+    """Return cmd with its executable resolved to an absolute path"""
+    return [resolve_executable(cmd[0]), *cmd[1:]]
+
+
+def run(cmd: Sequence[str], **kwargs: Any) -> subprocess.CompletedProcess:
+    """subprocess.run with the posix_spawn preconditions applied"""
+    return subprocess.run(spawn_argv(cmd), close_fds=False, **kwargs)
+
+
+def popen(cmd: Sequence[str], **kwargs: Any) -> subprocess.Popen:
+    """subprocess.Popen with the posix_spawn preconditions applied"""
+    return subprocess.Popen(spawn_argv(cmd), close_fds=False, **kwargs)
@@ -7,10 +7,15 @@ terminating lingering container shim processes.
 """
 from __future__ import annotations
 
+import json
+import os
 import shutil
 import subprocess
 import sys
-from typing import List, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from docker_monitor.cli import _proc
 
 
 class Colors:
@@ -26,44 +31,104 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+_HEX_DIGITS = frozenset('0123456789abcdef')
+
+# Header, step and result line templates, rendered once at import
+_RULE = f"{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.ENDC}"
+_HEADER = f"\n{_RULE}\n{Colors.BOLD}{Colors.CYAN}%s{Colors.ENDC}\n{_RULE}\n"
+_STEP = f"{Colors.BOLD}{Colors.YELLOW}→ %s{Colors.ENDC}"
+_RESULT_OK = f"{Colors.GREEN}✓ %s{Colors.ENDC}\n"
+_RESULT_FAIL = f"{Colors.RED}✗ %s{Colors.ENDC}\n"
+
+
 def run_command(cmd: Sequence[str]) -> subprocess.CompletedProcess:
     """Run a command and return the completed process"""
-    return subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=False)
+    return _proc.run(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=False,
+    )
+
+
+def run_lines_iter(cmd: Sequence[str]) -> Iterator[str]:
+    """Yield stripped non-empty stdout lines as the command produces them
+
+    Raises subprocess.CalledProcessError once the output is exhausted if the
+    command exited with a non-zero status.
+    """
+    with _proc.popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1,
+    ) as proc:
+        for line in iter(proc.stdout.readline, ''):
+            line = line.strip()
+            if line:
+                yield line
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 
 def format_bytes(size: int) -> str:
     """Return human-readable byte count"""
-    units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
-    value = float(size)
-    for unit in units:
-        if value < 1024 or unit == units[-1]:
-            if unit == 'B':
-                return f"{int(value)}{unit}"
-            return f"{value:.1f}{unit}"
-        value /= 1024
-    return f"{value:.1f}PB"
+    if size < 1024:
+        return f"{size}B"
+    # Each unit is 2**10 of the previous one, so the bit length picks the unit directly
+    idx = min((size.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{size / (1 << (idx * 10)):.1f}{_BYTE_UNITS[idx]}"
 
 
 def print_header(text: str):
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{text}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.ENDC}\n")
+    print(_HEADER % text)
 
 
 def print_step(title: str):
-    print(f"{Colors.BOLD}{Colors.YELLOW}→ {title}{Colors.ENDC}")
+    print(_STEP % title)
+
+
+def print_result(ok: bool, message: str):
+    print((_RESULT_OK if ok else _RESULT_FAIL) % message)
+
 
+def check_docker_available() -> Optional[dict]:
+    """Probe the Docker daemon once and return the parsed `docker version` output
 
-def check_docker_available() -> bool:
+    Returns None (after printing the reason) if Docker is unusable.
+    """
     if shutil.which('docker') is None:
         print(f"{Colors.RED}✗ Docker CLI not found on PATH. Install Docker before running dmm-cleanup.{Colors.ENDC}")
-        return False
-    result = run_command(['docker', 'info'])
+        return None
+    result = run_command(['docker', 'version', '--format', '{{json .}}'])
     if result.returncode != 0:
         print(f"{Colors.RED}✗ Unable to talk to Docker daemon: {result.stderr.strip()}{Colors.ENDC}")
         print(f"{Colors.YELLOW}Tip:{Colors.ENDC} Ensure the Docker daemon is running and you have sufficient permissions.")
-        return False
-    return True
+        return None
+    try:
+        return json.loads(result.stdout)
+    except ValueError:
+        return {}
+
+
+def _api_version_key(version: str) -> Tuple[int, ...]:
+    return tuple(int(part) for part in version.split('.'))
+
+
+def pin_docker_api_version(version_info: dict):
+    """Export the negotiated API version so later docker CLI calls skip negotiation
+
+    The pinned version must be one both sides speak: a newer daemon's version
+    would make the CLI fail with "client version is too new".
+    """
+    client_version = (version_info.get('Client') or {}).get('APIVersion')
+    server_version = (version_info.get('Server') or {}).get('APIVersion')
+    versions = [v for v in (client_version, server_version) if v]
+    if not versions:
+        return
+    try:
+        api_version = min(versions, key=_api_version_key)
+    except ValueError:
+        # Unparseable version string: let the CLI negotiate as usual
+        return
+    os.environ.setdefault('DOCKER_API_VERSION', api_version)
 
 
 def prune(title: str, cmd: Sequence[str]) -> Tuple[bool, str]:
@@ -75,31 +140,55 @@ def prune(title: str, cmd: Sequence[str]) -> Tuple[bool, str]:
     return False, result.stderr.strip() or 'Unknown error'
 
 
-def cleanup_orphaned_container_memory() -> Tuple[bool, str]:
-    """Detect and reclaim memory from orphaned container shim processes"""
-    try:
-        import psutil  # type: ignore
-    except ImportError:
-        return False, "psutil is not installed. Install it with 'pip install psutil'."
+def iter_shim_processes() -> Iterator[Tuple[int, List[str], int]]:
+    """Yield (pid, cmdline, rss) for containerd-shim processes by reading /proc directly"""
+    page_size = os.sysconf('SC_PAGE_SIZE')
 
-    all_containers = run_command(['docker', 'ps', '-a', '--no-trunc', '-q'])
-    if all_containers.returncode != 0:
-        return False, "Unable to list containers to verify memory cleanup"
+    with os.scandir('/proc') as entries:
+        for entry in entries:
+            pid = entry.name
+            if not pid.isdigit():
+                continue
 
-    known_ids = {line.strip() for line in all_containers.stdout.splitlines() if line.strip()}
+            # One unbuffered read of comm (<= 16 bytes) rules out non-shim processes
+            try:
+                with open(f'/proc/{pid}/comm', 'rb', buffering=0) as f:
+                    name = f.read(32)
+            except OSError:
+                continue
 
-    orphaned: List[Tuple['psutil.Process', str, int]] = []
+            # comm is truncated to 15 chars, so match on the stable prefix
+            if b'containerd-shim' not in name:
+                continue
 
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'memory_info']):
-        try:
-            name = (proc.info.get('name') or '').lower()
-        except psutil.Error:
-            continue
+            try:
+                with open(f'/proc/{pid}/cmdline') as f:
+                    cmdline = [arg for arg in f.read().split('\x00') if arg]
+                with open(f'/proc/{pid}/statm') as f:
+                    rss = int(f.read().split()[1]) * page_size
+            except (OSError, IndexError, ValueError):
+                continue
 
-        if 'containerd-shim' not in name:
-            continue
+            yield int(pid), cmdline, rss
+
+
+def cleanup_orphaned_container_memory() -> Tuple[bool, str]:
+    """Detect and reclaim memory from orphaned container shim processes"""
+    if not os.path.isdir('/proc'):
+        return True, "Orphaned shim detection is only supported on Linux"
+
+    # --no-trunc yields full 64-hex IDs, so an ID missing here is not a live container.
+    # IDs are kept as ints: roughly half the size of the hex strings and cheap to hash.
+    try:
+        known_ids = frozenset(int(line, 16) for line in run_lines_iter(['docker', 'ps', '-a', '--no-trunc', '-q']))
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        return False, "Unable to list containers to verify memory cleanup"
+    # The top 48 bits of a 256-bit ID are its 12-char short form
+    known_ids_12 = frozenset(known >> 208 for known in known_ids)
 
-        cmdline = proc.info.get('cmdline') or []
+    orphaned: List[Tuple[int, str, int]] = []
+
+    for pid, cmdline, rss in iter_shim_processes():
         container_id = None
 
         for idx, arg in enumerate(cmdline):
@@ -109,44 +198,60 @@ def cleanup_orphaned_container_memory() -> Tuple[bool, str]:
 
         if not container_id and cmdline:
             candidate = cmdline[-1]
-            if len(candidate) >= 12 and all(ch in '0123456789abcdef' for ch in candidate.lower()[:12]):
+            if len(candidate) >= 12 and _HEX_DIGITS.issuperset(candidate[:12].lower()):
                 container_id = candidate
 
-        if not container_id:
-            continue
-
-        if any(container_id.startswith(known) or known.startswith(container_id) for known in known_ids):
-            continue
-
-        inspect = run_command(['docker', 'inspect', container_id])
-        if inspect.returncode == 0:
-            # Container still exists; skip termination
+        # Non-hex IDs belong to other containerd clients, not Docker; leave them alone
+        if not container_id or not _HEX_DIGITS.issuperset(container_id.lower()):
             continue
 
-        try:
-            mem_info = proc.info.get('memory_info') or proc.memory_info()
-            rss = int(getattr(mem_info, 'rss', 0))
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
+        # Full IDs match exactly; shorter ones are compared on the 12-char short ID
+        if len(container_id) >= 64:
+            if int(container_id[:64], 16) in known_ids:
+                continue
+        elif len(container_id) >= 12:
+            if int(container_id[:12], 16) in known_ids_12:
+                continue
+        else:
+            # Too short to classify reliably: never kill what we can't match
             continue
 
-        orphaned.append((proc, container_id, rss))
+        orphaned.append((pid, container_id, rss))
 
     if not orphaned:
         return True, "No orphaned container shims detected"
 
-    total_reclaimed = 0
+    # Detection reads /proc directly; psutil is only needed to signal and reap
+    try:
+        import psutil  # type: ignore
+    except ImportError:
+        return False, "psutil is not installed. Install it with 'pip install psutil'."
+
     failures: List[str] = []
 
-    for proc, cid, rss in orphaned:
+    # Signal every shim first, then reap them together instead of waiting on each in turn
+    signalled = {}
+    for pid, cid, rss in orphaned:
         try:
+            proc = psutil.Process(pid)
             proc.terminate()
-            try:
-                proc.wait(timeout=5)
-            except psutil.TimeoutExpired:
-                proc.kill()
-            total_reclaimed += rss
         except (psutil.AccessDenied, psutil.NoSuchProcess) as exc:
             failures.append(f"{cid[:12]} ({exc})")
+            continue
+        signalled[proc] = (cid, rss)
+
+    _, alive = psutil.wait_procs(list(signalled), timeout=5)
+    for proc in alive:
+        try:
+            proc.kill()
+        except psutil.NoSuchProcess:
+            pass
+        except psutil.AccessDenied as exc:
+            failures.append(f"{signalled.pop(proc)[0][:12]} ({exc})")
+    if alive:
+        psutil.wait_procs(alive, timeout=2)
+
+    total_reclaimed = sum(rss for _, rss in signalled.values())
 
     if failures:
         details = ', '.join(failures)
@@ -170,8 +275,10 @@ def main(argv: Sequence[str] | None = None) -> int:
         print('Unexpected argument(s):', ' '.join(argv))
         return 1
 
-    if not check_docker_available():
+    version_info = check_docker_available()
+    if version_info is None:
         return 1
+    pin_docker_api_version(version_info)
 
     print_header("Docker Monitor Manager - Cleanup Tool")
     print(f"{Colors.CYAN}This will prune unused Docker resources and try to reclaim memory from lingering shims.{Colors.ENDC}")
@@ -186,22 +293,22 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     success = True
 
-    for title, cmd in tasks:
+    # Containers go first so their networks and volumes become prunable;
+    # the remaining prunes are independent and run concurrently.
+    results = [prune(*tasks[0])]
+    with ThreadPoolExecutor(max_workers=len(tasks) - 1) as executor:
+        futures = [executor.submit(prune, title, cmd) for title, cmd in tasks[1:]]
+        results.extend(future.result() for future in futures)
+
+    for (title, _), (ok, message) in zip(tasks, results):
         print_step(title)
-        ok, message = prune(title, cmd)
-        if ok:
-            print(f"{Colors.GREEN}✓ {message}{Colors.ENDC}\n")
-        else:
-            success = False
-            print(f"{Colors.RED}✗ {message}{Colors.ENDC}\n")
+        print_result(ok, message)
+        success = success and ok
 
     print_step("Releasing orphaned container memory")
     mem_ok, mem_message = cleanup_orphaned_container_memory()
-    if mem_ok:
-        print(f"{Colors.GREEN}✓ {mem_message}{Colors.ENDC}\n")
-    else:
-        success = False
-        print(f"{Colors.RED}✗ {mem_message}{Colors.ENDC}\n")
+    print_result(mem_ok, mem_message)
+    success = success and mem_ok
 
     print_header("Cleanup Summary")
     if success:
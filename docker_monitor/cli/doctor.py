@@ -13,13 +13,18 @@ This tool diagnoses common issues and suggests ways to fix them:
 """
 from __future__ import annotations
 
+import json
 import os
 import platform
 import shutil
+import socket
+import ssl
 import subprocess
 import sys
 from typing import List, Tuple
 
+from docker_monitor.cli import _proc
+
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -34,13 +39,30 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+# The host OS never changes during a run, so resolve it once
+_SYSTEM = platform.system().lower()
+
+# Header, check and fix line templates, rendered once at import
+_RULE = f"{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.ENDC}"
+_HEADER = f"\n{_RULE}\n{Colors.BOLD}{Colors.BLUE}%s{Colors.ENDC}\n{_RULE}\n"
+_CHECK_OK = f"{Colors.GREEN}✓{Colors.ENDC} %s: {Colors.GREEN}OK{Colors.ENDC}"
+_CHECK_FAIL = f"{Colors.RED}✗{Colors.ENDC} %s: {Colors.RED}FAIL{Colors.ENDC}"
+_CHECK_DETAIL = f"\n  {Colors.YELLOW}→{Colors.ENDC} %s"
+_FIX = f"  {Colors.CYAN}🔧 FIX:{Colors.ENDC} %s"
+
+# Cached result of the single `docker info` call shared by the checks below
+_DOCKER_PROBE: dict = {}
+
+
 def run_command(cmd: List[str], capture: bool = True) -> subprocess.CompletedProcess:
     """Run a command and return the result"""
     try:
         if capture:
-            return subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=False)
+            return _proc.run(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=False,
+            )
         else:
-            return subprocess.run(cmd, check=False)
+            return _proc.run(cmd, check=False)
     except FileNotFoundError:
         result = subprocess.CompletedProcess(cmd, returncode=127, stdout='', stderr='Command not found')
         return result
@@ -48,49 +70,77 @@ def run_command(cmd: List[str], capture: bool = True) -> subprocess.CompletedPro
 
 def print_header(text: str):
     """Print a section header"""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{text}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.ENDC}\n")
+    print(_HEADER % text)
 
 
 def print_check(name: str, status: bool, message: str = ""):
     """Print a check result"""
-    icon = f"{Colors.GREEN}✓{Colors.ENDC}" if status else f"{Colors.RED}✗{Colors.ENDC}"
-    status_text = f"{Colors.GREEN}OK{Colors.ENDC}" if status else f"{Colors.RED}FAIL{Colors.ENDC}"
-    print(f"{icon} {name}: {status_text}")
+    line = (_CHECK_OK if status else _CHECK_FAIL) % name
     if message:
-        print(f"  {Colors.YELLOW}→{Colors.ENDC} {message}")
+        line += _CHECK_DETAIL % message
+    print(line)
 
 
 def print_fix(message: str):
     """Print a fix action"""
-    print(f"  {Colors.CYAN}🔧 FIX:{Colors.ENDC} {message}")
+    print(_FIX % message)
+
+
+def _probe_docker() -> dict:
+    """Run `docker info` once and cache returncode, error text and parsed info"""
+    if not _DOCKER_PROBE:
+        if shutil.which('docker') is None:
+            # Without a CLI there is nothing to spawn; report it like a missing command
+            _DOCKER_PROBE.update(returncode=127, error='Command not found', info={})
+            return _DOCKER_PROBE
+        result = run_command(['docker', 'info', '--format', '{{json .}}'])
+        try:
+            info = json.loads(result.stdout) if result.stdout.strip() else {}
+        except ValueError:
+            info = {}
+        errors = [result.stderr.strip()] if result.stderr.strip() else []
+        errors.extend(info.get('ServerErrors') or [])
+        _DOCKER_PROBE.update(
+            returncode=result.returncode,
+            error='; '.join(errors),
+            info=info,
+        )
+    return _DOCKER_PROBE
+
+
+def _docker_daemon_ok(probe: dict) -> bool:
+    """Return True if the cached probe reached the Docker daemon"""
+    return probe['returncode'] == 0 and not probe['info'].get('ServerErrors')
 
 
 def check_docker_installed() -> Tuple[bool, str]:
     """Check if Docker is installed"""
-    result = run_command(['docker', '--version'])
-    if result.returncode == 0:
-        return True, result.stdout.strip()
-    return False, "Docker is not installed"
+    probe = _probe_docker()
+    if probe['returncode'] == 127:
+        return False, "Docker is not installed"
+    info = probe['info']
+    version = (info.get('ClientInfo') or {}).get('Version') or info.get('ServerVersion')
+    if version:
+        return True, f"Docker version {version}"
+    return True, "Docker CLI is installed"
 
 
 def check_docker_running() -> Tuple[bool, str]:
     """Check if Docker daemon is running"""
-    result = run_command(['docker', 'ps'])
-    if result.returncode == 0:
+    probe = _probe_docker()
+    if _docker_daemon_ok(probe):
         return True, "Docker daemon is running"
-    return False, f"Docker daemon is not running: {result.stderr.strip()}"
+    return False, f"Docker daemon is not running: {probe['error']}"
 
 
 def check_docker_permissions() -> Tuple[bool, str]:
     """Check if current user has Docker permissions"""
-    result = run_command(['docker', 'ps'])
-    if result.returncode == 0:
+    probe = _probe_docker()
+    if _docker_daemon_ok(probe):
         return True, "User has Docker permissions"
-    if 'permission denied' in result.stderr.lower():
+    if 'permission denied' in probe['error'].lower():
         return False, "Permission denied - user not in docker group"
-    return False, result.stderr.strip()
+    return False, probe['error']
 
 
 def check_docker_socket() -> Tuple[bool, str]:
@@ -105,14 +155,13 @@ def check_docker_socket() -> Tuple[bool, str]:
 
 def check_docker_service() -> Tuple[bool, str]:
     """Check Docker service status"""
-    system = platform.system().lower()
-    if system == 'linux':
+    if _SYSTEM == 'linux':
         # Try systemctl first
         result = run_command(['systemctl', 'is-active', 'docker'])
         if result.returncode == 0 and 'active' in result.stdout:
             return True, "Docker service is active"
         return False, "Docker service is not active"
-    elif system == 'darwin':
+    elif _SYSTEM == 'darwin':
         # macOS - check if Docker Desktop is running
         result = run_command(['pgrep', '-f', 'Docker.app'])
         if result.returncode == 0:
@@ -148,18 +197,22 @@ def check_system_resources() -> Tuple[bool, str]:
 
 def check_network_connectivity() -> Tuple[bool, str]:
     """Check if Docker Hub is accessible"""
-    result = run_command(['docker', 'search', '--limit', '1', 'alpine'])
-    if result.returncode == 0:
-        return True, "Docker Hub is accessible"
-    return False, "Cannot reach Docker Hub"
+    host = 'registry-1.docker.io'
+    try:
+        # A TLS handshake with the registry is enough; no need for a `docker search`
+        with socket.create_connection((host, 443), timeout=3) as sock:
+            with ssl.create_default_context().wrap_socket(sock, server_hostname=host):
+                pass
+    except OSError as e:
+        return False, f"Cannot reach Docker Hub: {e}"
+    return True, "Docker Hub is accessible"
 
 
 
 
 def fix_docker_permissions() -> None:
     """Suggest steps to fix Docker permissions issues"""
-    system = platform.system().lower()
-    if system != 'linux':
+    if _SYSTEM != 'linux':
         print_fix("Permission guidance only applies on Linux")
         return
 
@@ -174,12 +227,10 @@ def fix_docker_permissions() -> None:
 
 def fix_docker_service() -> None:
     """Suggest steps to start Docker service"""
-    system = platform.system().lower()
-
-    if system == 'linux':
+    if _SYSTEM == 'linux':
         print_fix("Run: sudo systemctl start docker")
         print_fix("Then run: sudo systemctl enable docker")
-    elif system == 'darwin':
+    elif _SYSTEM == 'darwin':
         print_fix("Please start Docker Desktop application manually")
     else:
         print_fix("Please start Docker Desktop manually")
@@ -195,8 +246,7 @@ def diagnose_docker_daemon_issues() -> List[str]:
         return issues
     
     # Check Docker service
-    system = platform.system().lower()
-    if system == 'linux':
+    if _SYSTEM == 'linux':
         result = run_command(['systemctl', 'status', 'docker'])
         if 'could not be found' in result.stderr.lower():
             issues.append("Docker service is not installed")
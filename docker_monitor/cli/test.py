@@ -9,10 +9,12 @@ This script creates three simple test containers used by the project:
 """
 from __future__ import annotations
 
+import json
 import subprocess
 import sys
 import time
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 
 class Colors:
@@ -45,32 +47,43 @@ def print_header(text: str):
 
 
 def print_status(name: str, status: str, extra: str = ""):
-    print(f"{name}: {status}")
-    if extra:
-        print(f"  -> {extra}")
+    print(f"{name}: {status}\n  -> {extra}" if extra else f"{name}: {status}")
 
 
-def cleanup_existing_test_containers():
+def list_containers() -> Optional[List[dict]]:
+    """Return all containers (including stopped) parsed from `docker ps` JSON lines, or None on failure"""
+    result = run_docker(['ps', '-a', '--format', '{{json .}}'])
+    if result.returncode != 0:
+        return None
+
+    containers = []
+    for line in result.stdout.splitlines():
+        try:
+            containers.append(json.loads(line))
+        except ValueError:
+            continue
+    return containers
+
+
+def cleanup_existing_test_containers(containers: Optional[List[dict]] = None):
     """Remove existing test containers"""
     print_header("Cleaning up existing test containers")
     
-    test_prefixes = ['dmm-test-', 'test-nginx']
+    test_prefixes = ('dmm-test-', 'test-nginx')
     
-    # Get all containers (including stopped)
-    result = run_docker(['ps', '-a', '--format', '{{.Names}}'])
-    if result.returncode != 0:
+    # Get all containers (including stopped) unless the caller already has them
+    if containers is None:
+        containers = list_containers()
+    if containers is None:
         print(f"{Colors.RED}Failed to list containers{Colors.ENDC}")
         return
     
-    containers = [c for c in result.stdout.strip().split('\n') if c]
+    test_containers = [c['Names'] for c in containers if c.get('Names', '').startswith(test_prefixes)]
     
-    # Filter and remove test containers using list comprehension
-    test_containers = [c for c in containers if any(c.startswith(prefix) for prefix in test_prefixes)]
-    
-    # Remove containers (sequential to avoid race conditions)
-    for container in test_containers:
-        print(f"Removing: {container}")
-        run_docker(['rm', '-f', container], capture=False)
+    # Remove all matches with a single docker invocation
+    if test_containers:
+        print(f"Removing: {', '.join(test_containers)}")
+        run_docker(['rm', '-f', *test_containers], capture=False)
     
     removed_count = len(test_containers)
     if removed_count > 0:
@@ -79,6 +92,23 @@ def cleanup_existing_test_containers():
         print(f"{Colors.CYAN}No test containers found{Colors.ENDC}")
 
 
+def provision(name: str, image: str, extra_args: List[str]) -> Tuple[str, str, str]:
+    """Pull an image and start a container from it, returning (name, status, detail)"""
+    # A failed pull is not fatal: a locally cached image still runs offline
+    pull = run_docker(['pull', image])
+
+    # Build the docker run command
+    cmd_args = ['run', '-d', '--name', name] + extra_args + [image]
+    result = run_docker(cmd_args)
+
+    if result.returncode == 0:
+        return name, 'created', ''
+    detail = result.stderr.strip()
+    if pull.returncode != 0:
+        detail = f"pull: {pull.stderr.strip()}; run: {detail}"
+    return name, 'failed', detail
+
+
 def create_normal_containers():
     """Create normal working containers"""
     print_header("Creating normal containers")
@@ -89,33 +119,31 @@ def create_normal_containers():
         ('dmm-test-postgres', 'postgres:alpine', ['-e', 'POSTGRES_PASSWORD=test123', '-p', '5432:5432']),
     ]
 
-    for name, image, extra_args in containers:
-        print(f"Pulling image: {image}")
-        run_docker(['pull', image], capture=False)
-
-        # Build the docker run command
-        cmd_args = ['run', '-d', '--name', name] + extra_args + [image]
-        result = run_docker(cmd_args)
-
-        if result.returncode == 0:
-            print_status(name, 'created')
-        else:
-            print_status(name, 'failed', result.stderr.strip())
-
+    print(f"Pulling images: {', '.join(image for _, image, _ in containers)}")
 
+    # Pulls are network-bound and independent, so overlap them
+    with ThreadPoolExecutor(max_workers=len(containers)) as executor:
+        futures = [executor.submit(provision, *spec) for spec in containers]
+        for future in futures:
+            print_status(*future.result())
 
 
-
-def show_container_status():
+def show_container_status(containers: Optional[List[dict]] = None):
     """Display status of all test containers"""
     print_header("Test containers status")
 
-    result = run_docker(['ps', '-a', '--filter', 'name=dmm-test-', '--format', '{{.Names}}\t{{.Status}}\t{{.Image}}'])
+    if containers is None:
+        containers = list_containers()
 
-    if result.returncode == 0:
-        print(result.stdout)
+    if containers is not None:
+        for c in containers:
+            if c.get('Names', '').startswith('dmm-test-'):
+                print(f"{c['Names']}\t{c.get('Status', '')}\t{c.get('Image', '')}")
+        print()
     else:
         print('Failed to get container status')
+
+
 def main(argv=None):
     """Main entry point"""
     if argv is None:
@@ -134,9 +162,9 @@ def main(argv=None):
             print('Usage: dmm-test [cleanup|status]')
             return 1
     
-    # Check if Docker is available
-    result = run_docker(['ps'])
-    if result.returncode != 0:
+    # Check if Docker is available; the listing is reused by cleanup/status
+    containers = list_containers()
+    if containers is None:
         print(f"{Colors.RED}Error: Docker is not running or not accessible{Colors.ENDC}")
         print(f"\nPlease run: {Colors.CYAN}dmm-doctor{Colors.ENDC} to diagnose issues")
         return 1
@@ -146,15 +174,15 @@ def main(argv=None):
     print(f"{Colors.BOLD}{Colors.HEADER}{'='*60}{Colors.ENDC}\n")
     
     if command == 'cleanup':
-        cleanup_existing_test_containers()
+        cleanup_existing_test_containers(containers)
         return 0
     
     if command == 'status':
-        show_container_status()
+        show_container_status(containers)
         return 0
     
     # Cleanup before creating new containers
-    cleanup_existing_test_containers()
+    cleanup_existing_test_containers(containers)
 
     # Create normal containers
     create_normal_containers()
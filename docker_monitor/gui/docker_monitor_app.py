@@ -33,8 +33,7 @@ from docker_monitor.utils.docker_utils import (
     CLONE_NUM,
     SLEEP_TIME,
     AUTO_SCALE_ENABLED,
-    monitor_thread,
-    docker_events_listener
+    monitor_thread
 )
 from docker_monitor.utils.worker import run_in_thread
 from docker_monitor.utils.observer import Observer
@@ -835,6 +834,10 @@ class DockerMonitorApp(tk.Tk, Observer):
             else:
                 self.tree.column(col, width=100, anchor=tk.CENTER)
 
+        # Alternating row colors, applied by ContainerManager.reapply_row_tags
+        self.tree.tag_configure('oddrow', background=self.FRAME_BG)
+        self.tree.tag_configure('evenrow', background=self.BG_COLOR)
+
         # Only vertical scrollbar
         scrollbar_y = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
         self.tree.configure(yscroll=scrollbar_y.set)
@@ -1049,6 +1052,10 @@ class DockerMonitorApp(tk.Tk, Observer):
             else:
                 self.volumes_tree.column(col, width=150, anchor=tk.CENTER)
 
+        # Alternating row colors, assigned per row by VolumeManager.update_volumes_tree
+        self.volumes_tree.tag_configure('oddrow', background=self.FRAME_BG)
+        self.volumes_tree.tag_configure('evenrow', background=self.BG_COLOR)
+
         # Only vertical scrollbar (no horizontal)
         vol_scroll_y = ttk.Scrollbar(vol_frame, orient=tk.VERTICAL, command=self.volumes_tree.yview)
         self.volumes_tree.configure(yscroll=vol_scroll_y.set)
@@ -2036,11 +2043,7 @@ class DockerMonitorApp(tk.Tk, Observer):
 
     def _update_volumes_from_list(self, vol_list):
         """Update volumes tree view with volume list."""
-        self.vol_tags_configured = VolumeManager.update_volumes_tree(
-            self.volumes_tree, vol_list, 
-            getattr(self, 'vol_tags_configured', False),
-            self.BG_COLOR, self.FRAME_BG
-        )
+        VolumeManager.update_volumes_tree(self.volumes_tree, vol_list)
 
     def update_volumes_list(self):
         """Update volumes list periodically - only when volumes tab is active."""
@@ -2055,7 +2058,9 @@ class DockerMonitorApp(tk.Tk, Observer):
             return VolumeManager.fetch_volumes()
 
         def _on_done(vol_list):
-            self._on_volumes_fetched(vol_list)
+            # Through the controller, so its cache stays current for
+            # VolumeManager's single-volume add/remove updates
+            self.docker_controller.update_volumes(vol_list)
 
         def _on_error(e):
             logging.error(f"Error updating volumes list: {e}")
@@ -2082,8 +2087,11 @@ class DockerMonitorApp(tk.Tk, Observer):
             VolumeManager.prune_volumes(self.refresh_all_tabs, self.status_bar)
             return
         
+        # Create/remove patch the controller's volume cache, whose 'volumes_updated'
+        # notification redraws the tree; update_volumes_list would re-list every
+        # volume and start another 5s polling chain
         VolumeManager.run_volume_action(
-            self.volumes_tree, action, self.update_volumes_list, self
+            self.volumes_tree, action, None, self
         )
 
     def _update_images_from_list(self, img_list):
@@ -2174,7 +2182,10 @@ class DockerMonitorApp(tk.Tk, Observer):
                                                   'This will delete every image on your system!\n'
                                                   'This action cannot be undone.\n\n'
                                                   'Continue?')
-            ImageManager.remove_all_images(confirm, lambda msg: self.status_bar.config(text=msg), self.update_images_list)
+            ImageManager.remove_all_images(
+                confirm, lambda msg: self.status_bar.config(text=msg), self.update_images_list,
+                tk_root=self.status_bar
+            )
     
     def run_network_global_action(self, action):
         """Handle network bulk actions."""
@@ -2476,7 +2487,7 @@ class DockerMonitorApp(tk.Tk, Observer):
             def _fetch():
                 try:
                     vol_list = VolumeManager.fetch_volumes()
-                    self.after(0, lambda: self._on_volumes_fetched(vol_list))
+                    self.docker_controller.update_volumes(vol_list)
                 except Exception as e:
                     logging.error(f"Error fetching volumes: {e}")
             from docker_monitor.utils.worker import run_in_thread
@@ -2622,8 +2633,7 @@ class DockerMonitorApp(tk.Tk, Observer):
         def fetch_and_show():
             try:
                 # Get all containers in background thread
-                with docker_lock:
-                    all_containers = client.containers.list(all=True)
+                all_containers = client.containers.list(all=True)
                 
                 # Schedule UI update in main thread
                 self.after(0, lambda: self._show_connect_dialog(net, all_containers))
@@ -2994,7 +3004,7 @@ class DockerMonitorApp(tk.Tk, Observer):
 
     def _fetch_all_stats_for_refresh(self):
         """Worker function for the manual refresh thread."""
-        stats_list = ContainerManager.fetch_all_stats()
+        stats_list = ContainerManager.fetch_all_stats(force_list=True)
         if stats_list:
             manual_refresh_queue.put(stats_list)
 
@@ -3098,6 +3108,8 @@ class DockerMonitorApp(tk.Tk, Observer):
         """Helper function to update the Treeview from a list of stats."""
         # Coalesce rapid updates: store latest stats and debounce the UI update
         self._all_containers = stats_list
+        # Rebuilt lazily by filter_containers, once per new stats list
+        self._container_search_index = None
 
         # If search/filter is active, apply filter immediately on main thread
         if hasattr(self, 'container_search_var') and self.container_search_var.get():
@@ -3118,9 +3130,7 @@ class DockerMonitorApp(tk.Tk, Observer):
     
     def _apply_containers_to_tree(self, stats_list):
         """Apply container list to tree view."""
-        self.tree_tags_configured = ContainerManager.apply_containers_to_tree(
-            self.tree, stats_list, self.tree_tags_configured, self.BG_COLOR, self.FRAME_BG
-        )
+        ContainerManager.apply_containers_to_tree(self.tree, stats_list)
     
     def filter_containers(self):
         """Filter containers based on search query."""
@@ -3128,7 +3138,11 @@ class DockerMonitorApp(tk.Tk, Observer):
             return
             
         search_text = self.container_search_var.get()
-        filtered = ContainerManager.filter_containers(self._all_containers, search_text)
+        if getattr(self, '_container_search_index', None) is None:
+            self._container_search_index = ContainerManager.build_search_index(self._all_containers)
+        filtered = ContainerManager.filter_containers(
+            self._all_containers, self._container_search_index, search_text
+        )
         self._apply_containers_to_tree(filtered)
 
     def filter_networks(self):
@@ -3154,10 +3168,7 @@ class DockerMonitorApp(tk.Tk, Observer):
         if not hasattr(self, '_all_volumes'):
             return
         
-        VolumeManager.filter_volumes(
-            self.volumes_tree, self._all_volumes, 
-            self.volumes_search_var, self.BG_COLOR, self.FRAME_BG
-        )
+        VolumeManager.filter_volumes(self.volumes_tree, self._all_volumes, self.volumes_search_var)
 
     # === Observer Pattern Implementation ===
     
@@ -3206,11 +3217,11 @@ class DockerMonitorApp(tk.Tk, Observer):
                     self.after(0, lambda: self._on_volumes_fetched(payload))
                     logging.debug(f"UI updated with {len(payload)} volumes")
                 
-            elif event_type == 'docker_event':
-                # Handle real-time Docker events
-                if payload is not None:
-                    action = payload.get('Action', '')
-                    actor_type = payload.get('Type', '')
+            elif event_type == 'docker_events_batch':
+                # Handle a burst of real-time Docker events
+                for event in payload or ():
+                    action = event.get('Action', '')
+                    actor_type = event.get('Type', '')
                     logging.debug(f"Docker event: {action} on {actor_type}")
                 
             elif event_type == 'container_action':
@@ -3335,13 +3346,12 @@ class DockerMonitorApp(tk.Tk, Observer):
         try:
             # Use shared thread pool to fetch system counts
             def _fetch():
-                with docker_lock:
-                    containers = client.containers.list(all=True)
-                    running = sum(1 for c in containers if c.status == 'running')
-                    total = len(containers)
-                    images = len(client.images.list())
-                    volumes = len(client.volumes.list())
-                    networks = len(client.networks.list())
+                containers = client.containers.list(all=True)
+                running = sum(1 for c in containers if c.status == 'running')
+                total = len(containers)
+                images = len(client.images.list())
+                volumes = len(client.volumes.list())
+                networks = len(client.networks.list())
                 return (running, total, images, volumes, networks)
 
             def _on_done(result):
@@ -3410,9 +3420,12 @@ def main():
     # and are intentionally started as raw daemon threads at process init.
     monitor = threading.Thread(target=monitor_thread, daemon=True)
     monitor.start()
-    
-    events_listener = threading.Thread(target=docker_events_listener, daemon=True)
-    events_listener.start()
+
+    # The single container events consumer: refreshes stats (coalesced) whenever
+    # a container changes and forwards the events to the controller's observers
+    ContainerManager.start_event_refresh()
+    # Keep the cached image list in step with pulls, tags and removals
+    ImageManager.start_event_watch()
 
     # Start the Tkinter GUI
     app = DockerMonitorApp()
@@ -4,21 +4,180 @@ Handles all container-related operations including listing, actions, and informa
 """
 
 import logging
+import queue
+import threading
+import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from tkinter import messagebox
+from docker.models.containers import Container
 from docker_monitor.utils.docker_utils import (
     client,
-    docker_lock,
     get_container_stats,
+    prune_cpu_samples,
     docker_cleanup
 )
-from docker_monitor.utils.worker import run_in_thread
+from docker_monitor.utils.worker import DockerWorker, run_in_thread
 from docker_monitor.utils.docker_controller import get_docker_controller
 
+log = logging.getLogger(__name__)
+
 
 class ContainerManager:
     """Manages Docker container operations and display."""
+
+    # Container changes that should trigger a stats refresh and invalidate the cached list
+    REFRESH_EVENTS = ['create', 'start', 'die', 'pause', 'unpause', 'destroy', 'rename', 'update']
+    # Window used to collapse a burst of events/actions into a single refresh
+    REFRESH_DEBOUNCE = 0.3
+    # Poll interval used while the events stream is unavailable
+    EVENTS_RETRY_INTERVAL = 2.0
+    # Cap on concurrent per-container API calls; the daemon degrades beyond ~10
+    MAX_PARALLEL_DOCKER_CALLS = 10
+    # How long inspect data shown in the Info tab may be reused
+    ATTRS_TTL = 5.0
+
+    # container name -> (monotonic timestamp, attrs); dropped on state-change events
+    _attrs_cache = {}
+
+    # container name -> values tuple last written to the tree row
+    _last_row_values = {}
+
+    # CPU baselines for fetch_all_stats, separate from the background monitor loop's
+    _cpu_samples = {}
+
+    # Styling for the Info tab text tags
+    INFO_TAGS = {
+        'title': {'foreground': '#00ff88', 'font': ('Segoe UI', 14, 'bold')},
+        'section': {'foreground': '#00ADB5', 'font': ('Segoe UI', 12, 'bold')},
+        'key': {'foreground': '#FFD700', 'font': ('Segoe UI', 10, 'bold')},
+        'value': {'foreground': '#EEEEEE', 'font': ('Segoe UI', 10)},
+    }
+    # Widget paths whose INFO_TAGS are already configured
+    _info_tags_configured = set()
+
+    _refresh_requests = queue.Queue()
+    _event_refresh_started = False
+
+    # Bumped by every container event; fetch_all_stats reuses its last
+    # containers.list() result while the revision is unchanged and the
+    # events stream is connected (status is part of the listed objects).
+    _container_list_revision = 0
+    _container_list_cache = (None, [])
+    _events_live = False
+
+    # Single-container actions offered by the UI
+    _ACTION_TABLE = {
+        'start': Container.start,
+        'stop': Container.stop,
+        'pause': Container.pause,
+        'unpause': Container.unpause,
+        'restart': Container.restart,
+        # Do NOT perform automatic cleanup after removal; resource pruning
+        # should only happen when the user triggers a prune action via the UI.
+        # This avoids unexpected image/volume/network pruning.
+        'remove': lambda c: (c.stop(), c.remove(force=True)),
+    }
+
+    # Shared across bulk operations so overlapping batches still respect the cap
+    _bulk_slots = threading.BoundedSemaphore(MAX_PARALLEL_DOCKER_CALLS)
+
+    @staticmethod
+    def start_event_refresh():
+        """Start the background threads that refresh container stats on Docker events.
+
+        Safe to call more than once; the threads are only started the first time.
+        """
+        if ContainerManager._event_refresh_started:
+            return
+        ContainerManager._event_refresh_started = True
+        threading.Thread(target=ContainerManager._watch_container_events, daemon=True).start()
+        threading.Thread(target=ContainerManager._coalesce_refreshes, daemon=True).start()
+
+    @staticmethod
+    def request_refresh(reason='manual'):
+        """Ask the coalescer thread for a stats refresh."""
+        ContainerManager._refresh_requests.put(reason)
+
+    @staticmethod
+    def _watch_container_events():
+        """Subscribe to container events and queue a refresh for each relevant one.
+
+        This is the app's only container events subscription; events are also
+        passed on to the controller for its observers.
+        """
+        filters = {'type': 'container', 'event': ContainerManager.REFRESH_EVENTS}
+        controller = get_docker_controller()
+        while True:
+            try:
+                events = client.events(decode=True, filters=filters)
+                # Anything may have changed while disconnected
+                ContainerManager._container_list_revision += 1
+                ContainerManager._events_live = True
+                for event in events:
+                    ContainerManager._container_list_revision += 1
+                    attrs = event.get('Actor', {}).get('Attributes') or {}
+                    ContainerManager._attrs_cache.pop(attrs.get('name'), None)
+                    # A rename reports the new name; the cached attrs are under the old one
+                    old_name = attrs.get('oldName')
+                    if old_name:
+                        ContainerManager._attrs_cache.pop(old_name.lstrip('/'), None)
+                    ContainerManager.request_refresh(event.get('Action', 'event'))
+                    controller.notify_docker_event(event)
+            except Exception as e:
+                log.debug("Container events stream dropped: %s", e)
+            ContainerManager._events_live = False
+            # Stream ended or could not connect: fall back to polling until it reconnects
+            ContainerManager.request_refresh('poll')
+            time.sleep(ContainerManager.EVENTS_RETRY_INTERVAL)
+
+    @staticmethod
+    def _coalesce_refreshes():
+        """Run one fetch_all_stats() per burst of refresh requests."""
+        controller = get_docker_controller()
+        requests = ContainerManager._refresh_requests
+        while True:
+            requests.get()
+            # Swallow everything else that arrives within the debounce window
+            deadline = time.monotonic() + ContainerManager.REFRESH_DEBOUNCE
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            try:
+                stats = ContainerManager.fetch_all_stats(raise_errors=True)
+            except Exception as e:
+                # Keep the last published list rather than blanking the tree
+                log.error("Event-driven container refresh failed: %s", e)
+                continue
+            controller.update_containers(stats)
     
+    @staticmethod
+    def _map_containers(fn, containers):
+        """Apply fn to every container concurrently.
+
+        Returns a list of (container, error) pairs in input order, where error
+        is None if fn succeeded.
+        """
+        def _guarded(container):
+            with ContainerManager._bulk_slots:
+                try:
+                    fn(container)
+                    return container, None
+                except Exception as exc:
+                    return container, exc
+
+        if not containers:
+            return []
+        workers = min(ContainerManager.MAX_PARALLEL_DOCKER_CALLS, len(containers))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_guarded, containers))
+
     @staticmethod
     def run_container_action(tree, action):
         """Runs an action (stop, pause, restart, remove, etc.) on the selected container.
@@ -29,12 +188,16 @@ class ContainerManager:
         """
         selected_items = tree.selection()
         if not selected_items:
-            logging.warning("No container selected for action.")
+            log.warning("No container selected for action.")
             return
 
         item = tree.item(selected_items[0])
         container_name = item['values'][1]
-        logging.info(f"User requested '{action}' on container '{container_name}'.")
+        handler = ContainerManager._ACTION_TABLE.get(action)
+        if handler is None:
+            log.warning("Unsupported container action '%s'.", action)
+            return
+        log.info("User requested '%s' on container '%s'.", action, container_name)
         
         # Get controller instance for notifications
         controller = get_docker_controller()
@@ -42,33 +205,21 @@ class ContainerManager:
             success = False
             error_msg = None
             try:
-                with docker_lock:
-                    container = client.containers.get(container_name)
-                    if action == 'remove':
-                        container.stop()
-                        container.remove(force=True)
-                        # Do NOT perform automatic cleanup here; resource pruning
-                        # should only happen when the user triggers a prune action
-                        # via the UI. This avoids unexpected image/volume/network
-                        # pruning after container removal.
-                    elif hasattr(container, action):
-                        getattr(container, action)()
-                    success = True
+                handler(client.containers.get(container_name))
+                success = True
             except Exception as exc:
                 error_msg = str(exc)
-                logging.error(f"Error during '{action}' on container '{container_name}': {exc}")
+                log.error("Error during '%s' on container '%s': %s", action, container_name, exc)
 
+            # The events stream normally triggers the refresh; also ask for one in
+            # case the stream is down. Both collapse into a single coalesced sweep.
+            ContainerManager.request_refresh('action')
             controller.notify_container_action(action, container_name, success, error_msg)
 
-            if success:
-                stats_list = ContainerManager.fetch_all_stats()
-                controller.update_containers(stats_list)
-
-        run_in_thread(
+        # Mutations are serialized on the Docker worker thread instead of docker_lock
+        DockerWorker.submit(
             _perform_action,
-            on_error=lambda exc: logging.error(f"Container action worker failed: {exc}"),
-            tk_root=None,
-            block=False,
+            on_error=lambda exc: log.error("Container action worker failed: %s", exc),
         )
 
     @staticmethod
@@ -78,39 +229,37 @@ class ContainerManager:
         Args:
             action: Action to perform (stop, pause, unpause, restart, remove)
         """
-        logging.info(f"User requested '{action}' on ALL containers.")
+        log.info("User requested '%s' on ALL containers.", action)
         controller = get_docker_controller()
 
         def _perform_global_action():
             try:
-                with docker_lock:
-                    containers = client.containers.list(all=True)
-
-                    action_handlers = {
-                        'pause': lambda c: c.pause() if c.status == 'running' else None,
-                        'unpause': lambda c: c.unpause() if c.status == 'paused' else None,
-                        'stop': lambda c: c.stop() if c.status == 'running' else None,
-                        'restart': lambda c: c.restart(),
-                        'remove': lambda c: (c.stop(), c.remove(force=True)),
-                    }
-
-                    handler = action_handlers.get(action)
-                    if handler:
-                        list(map(lambda c: handler(c) if handler else None, containers))
+                containers = client.containers.list(all=True)
+
+                action_handlers = {
+                    'pause': lambda c: c.pause() if c.status == 'running' else None,
+                    'unpause': lambda c: c.unpause() if c.status == 'paused' else None,
+                    'stop': lambda c: c.stop() if c.status == 'running' else None,
+                    'restart': lambda c: c.restart(),
+                    'remove': lambda c: (c.stop(), c.remove(force=True)),
+                }
+
+                handler = action_handlers.get(action)
+                if handler:
+                    for container, exc in ContainerManager._map_containers(handler, containers):
+                        if exc is not None:
+                            log.error("Error during global '%s' on '%s': %s", action, container.name, exc)
+                            controller.notify_container_action(action, container.name, False, str(exc))
 
                 # Do NOT perform automatic cleanup after global actions.
                 # Pruning must be initiated explicitly via the UI prune buttons.
-
-                stats_list = ContainerManager.fetch_all_stats()
-                controller.update_containers(stats_list)
             except Exception as exc:
-                logging.error(f"Error during global '{action}': {exc}")
+                log.error("Error during global '%s': %s", action, exc)
+            ContainerManager.request_refresh('action')
 
-        run_in_thread(
+        DockerWorker.submit(
             _perform_global_action,
-            on_error=lambda exc: logging.error(f"Global container action worker failed: {exc}"),
-            tk_root=None,
-            block=False,
+            on_error=lambda exc: log.error("Global container action worker failed: %s", exc),
         )
 
     @staticmethod
@@ -128,7 +277,7 @@ class ContainerManager:
         if not confirm:
             return
         
-        logging.info("⏹️  Stopping all containers...")
+        log.info("⏹️  Stopping all containers...")
         if status_bar_callback:
             status_bar_callback("🔄 Stopping containers...")
         
@@ -136,85 +285,92 @@ class ContainerManager:
             try:
                 containers = client.containers.list()
                 
-                # Define stop function to avoid repeated try-catch in loop
+                # Runs on the bulk pool, so each result is reported as soon as that stop returns
                 def try_stop(container):
                     try:
                         container.stop(timeout=10)
-                        if log_callback:
-                            log_callback(lambda name=container.name: logging.info(f"⏹️  Stopped: {name}"))
-                        return True
                     except Exception as e:
                         if log_callback:
-                            log_callback(lambda name=container.name, err=e: logging.warning(f"⚠️  Failed to stop {name}: {err}"))
-                        return False
+                            log_callback(partial(log.warning, "⚠️  Failed to stop %s: %s", container.name, e))
+                        raise
+                    if log_callback:
+                        log_callback(partial(log.info, "⏹️  Stopped: %s", container.name))
                 
-                # Use list comprehension and sum for counting - faster than loop
-                stopped = sum(1 for c in containers if try_stop(c))
+                results = ContainerManager._map_containers(try_stop, containers)
+                stopped = sum(1 for _, exc in results if exc is None)
                 
                 if log_callback:
-                    log_callback(lambda count=stopped: logging.info(f"✅ Stopped {count} containers"))
+                    log_callback(partial(log.info, "✅ Stopped %d containers", stopped))
                 if status_bar_callback:
                     status_bar_callback(f"✅ Stopped {stopped} containers")
             except Exception as e:
-                logging.error(f"Error stopping all containers: {e}")
+                log.error("Error stopping all containers: %s", e)
                 if status_bar_callback:
                     status_bar_callback("❌ Error stopping containers")
-        # Run the stop_all function in the shared worker so the UI/main thread is not blocked.
-        run_in_thread(stop_all, on_done=None, on_error=lambda e: logging.error(f"stop_all failed: {e}"), tk_root=None, block=False)
+            ContainerManager.request_refresh('action')
+        # Run stop_all on the Docker worker so the UI/main thread is not blocked.
+        DockerWorker.submit(stop_all, on_error=lambda e: log.error("stop_all failed: %s", e))
 
     @staticmethod
-    def apply_containers_to_tree(tree, stats_list, tree_tags_configured, bg_color, frame_bg):
+    def apply_containers_to_tree(tree, stats_list):
         """Apply container list to tree view.
         
+        The 'evenrow'/'oddrow' tags are configured once when the tree is created.
+        
         Args:
             tree: Treeview widget
             stats_list: List of container stats dictionaries
-            tree_tags_configured: Boolean indicating if tags are configured
-            bg_color: Background color for rows
-            frame_bg: Frame background color for alternating rows
-            
-        Returns:
-            Boolean indicating if tags were configured
         """
-        if not tree_tags_configured:
-            tree.tag_configure('oddrow', background=frame_bg)
-            tree.tag_configure('evenrow', background=bg_color)
-            tree_tags_configured = True
-
         # Save current selection
         current_selection = tree.selection()
         selected_iid = current_selection[0] if current_selection else None
 
         # Use names as unique identifiers (since we use name as iid)
         current_names = {item['name'] for item in stats_list}
-        tree_items = tree.get_children()
-
-        # Batch delete using filter - more efficient than loop with conditionals
-        to_delete = [child for child in tree_items if child not in current_names]
-        list(map(tree.delete, to_delete))
-
-        # Batch update/insert using comprehension - prepare all data first
+        tree_items = set(tree.get_children())
+        last_row_values = ContainerManager._last_row_values
+
+        to_delete = list(tree_items - current_names)
+        if to_delete:
+            # ttk::treeview deletes a whole item list in one Tcl call
+            tree.delete(*to_delete)
+        for name in to_delete:
+            last_row_values.pop(name, None)
+        # Deleting rows shifts the parity of the ones after them
+        retag_all = bool(to_delete)
+        row_count = len(tree_items) - len(to_delete)
+
+        # Batch update/insert using comprehension - prepare all data first.
+        # 'id' is already the 12-char short ID (see get_container_stats).
         updates = [
             (item['name'], 
-             (item['id'][:12] if len(item['id']) > 12 else item['id'], 
-              item['name'], item['status'], item['cpu'], item['ram']))
+             (item['id'], item['name'], item['status'], item['cpu'], item['ram']))
             for item in stats_list
         ]
         
-        # Apply updates/inserts (still need individual calls but data is prepared)
+        # Only touch rows whose values changed; each tree call is a Tcl round-trip.
+        # Calling the widget command directly skips ttk's per-call option formatting;
+        # the values tuple is handed to Tcl as a native list.
+        call = tree.tk.call
+        widget = tree._w
         for name, values in updates:
-            if tree.exists(name):
-                tree.item(name, values=values)
+            if name not in tree_items:
+                # Appended rows can take their parity tag directly
+                tag = 'evenrow' if row_count % 2 == 0 else 'oddrow'
+                call(widget, 'insert', '', 'end', '-id', name, '-values', values, '-tags', tag)
+                row_count += 1
+            elif last_row_values.get(name) == values:
+                continue
             else:
-                tree.insert('', tk.END, iid=name, values=values)
+                call(widget, 'item', name, '-values', values)
+            last_row_values[name] = values
         
-        ContainerManager.reapply_row_tags(tree)
+        if retag_all:
+            ContainerManager.reapply_row_tags(tree)
         
         # Restore selection if it still exists
         if selected_iid and tree.exists(selected_iid):
             tree.selection_set(selected_iid)
-        
-        return tree_tags_configured
     
     @staticmethod
     def reapply_row_tags(tree):
@@ -223,17 +379,36 @@ class ContainerManager:
         Args:
             tree: Treeview widget
         """
-        # Use map instead of explicit loop - faster for bulk operations
         children = tree.get_children()
-        list(map(lambda i_iid: tree.item(i_iid[1], tags=('evenrow' if i_iid[0] % 2 == 0 else 'oddrow',)), 
-                 enumerate(children)))
+        call = tree.tk.call
+        widget = tree._w
+        # Four Tcl calls regardless of row count instead of one item call per row;
+        # tag remove without an item list clears the tag from every row.
+        call(widget, 'tag', 'remove', 'evenrow')
+        call(widget, 'tag', 'remove', 'oddrow')
+        call(widget, 'tag', 'add', 'evenrow', children[0::2])
+        call(widget, 'tag', 'add', 'oddrow', children[1::2])
+
+    @staticmethod
+    def build_search_index(all_containers):
+        """Build the lowercase search index used by filter_containers.
+        
+        Args:
+            all_containers: List of all container stats
+            
+        Returns:
+            List of strings parallel to all_containers, one per container
+        """
+        # NUL separators keep a query from matching across field boundaries
+        return [f"{c['name']}\0{c['status']}\0{c['id']}".lower() for c in all_containers]
 
     @staticmethod
-    def filter_containers(all_containers, search_text):
+    def filter_containers(all_containers, search_index, search_text):
         """Filter containers based on search query.
         
         Args:
             all_containers: List of all container stats
+            search_index: Output of build_search_index for all_containers
             search_text: Search query string
             
         Returns:
@@ -243,28 +418,46 @@ class ContainerManager:
             return all_containers
         
         search_text = search_text.lower()
-        return [
-            c for c in all_containers
-            if search_text in c['name'].lower() or 
-               search_text in c['status'].lower() or
-               search_text in c['id'].lower()
-        ]
+        return [all_containers[i] for i, entry in enumerate(search_index) if search_text in entry]
 
     @staticmethod
-    def fetch_all_stats():
+    def fetch_all_stats(force_list=False, raise_errors=False):
         """Fetch stats for all containers.
         
+        Args:
+            force_list: Re-list containers even if the cached list is still current
+            raise_errors: Re-raise listing errors instead of returning an empty list,
+                so callers can tell a failure apart from "no containers"
+            
         Returns:
             List of container stats dictionaries
         """
-        with docker_lock:
-            try:
+        try:
+            # Read the revision before listing so an event that lands mid-list
+            # invalidates the result for the next call
+            revision = ContainerManager._container_list_revision
+            cached_revision, cached = ContainerManager._container_list_cache
+            if not force_list and ContainerManager._events_live and cached_revision == revision:
+                all_containers = cached
+            else:
+                # Read-only: no docker_lock needed, the SDK client handles concurrent GETs
                 all_containers = client.containers.list(all=True)
-                # Filter out None results (removed containers)
-                return [s for s in (get_container_stats(c) for c in all_containers) if s is not None]
-            except Exception as e:
-                logging.error(f"Error fetching container stats: {e}")
+                ContainerManager._container_list_cache = (revision, all_containers)
+            prune_cpu_samples(ContainerManager._cpu_samples, all_containers)
+            if not all_containers:
                 return []
+            # Each stats call blocks on its own HTTP request, so fan them out.
+            # The SDK's connection pool is safe for concurrent GETs.
+            workers = min(ContainerManager.MAX_PARALLEL_DOCKER_CALLS, len(all_containers))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Filter out None results (removed containers)
+                get_stats = partial(get_container_stats, cpu_samples=ContainerManager._cpu_samples)
+                return [s for s in executor.map(get_stats, all_containers) if s is not None]
+        except Exception as e:
+            if raise_errors:
+                raise
+            log.error("Error fetching container stats: %s", e)
+            return []
 
     @staticmethod
     def display_container_info(info_text, container_name, placeholder_label):
@@ -281,111 +474,132 @@ class ContainerManager:
         except Exception:
             pass
 
-        # Use shared worker to fetch container attrs and render in main thread
+        # Use shared worker to fetch container attrs and build the text; render in main thread
         from docker_monitor.utils.worker import run_in_thread
 
         def _fetch():
-            with docker_lock:
-                try:
-                    container = client.containers.get(container_name)
-                    return container.attrs
-                except Exception as e:
-                    # Convert NotFound into a sentinel None so the on_done
-                    # renderer can show a friendly message instead of propagating
-                    # exceptions back through the worker scheduling (which may
-                    # fail if the Tk mainloop isn't available).
-                    import docker as _docker
-                    if isinstance(e, getattr(_docker.errors, 'NotFound', Exception)):
-                        logging.debug(f"Container {container_name} disappeared before fetch: {e}")
-                        return None
-                    raise
-
-        def _render_info(info):
+            cached = ContainerManager._attrs_cache.get(container_name)
+            if cached and time.monotonic() - cached[0] < ContainerManager.ATTRS_TTL:
+                return cached[1]
             try:
-                if info is None:
+                container = client.containers.get(container_name)
+                ContainerManager._attrs_cache[container_name] = (time.monotonic(), container.attrs)
+                return container.attrs
+            except Exception as e:
+                # Convert NotFound into a sentinel None so the on_done
+                # renderer can show a friendly message instead of propagating
+                # exceptions back through the worker scheduling (which may
+                # fail if the Tk mainloop isn't available).
+                import docker as _docker
+                if isinstance(e, getattr(_docker.errors, 'NotFound', Exception)):
+                    log.debug("Container %s disappeared before fetch: %s", container_name, e)
+                    return None
+                raise
+
+        def _render_info(segments):
+            try:
+                if segments is None:
                     ContainerManager._show_error(info_text, f"Container '{container_name}' not found")
                     return
+                ContainerManager._configure_info_tags(info_text)
                 info_text.config(state='normal')
                 info_text.delete('1.0', tk.END)
-
-                info_text.insert(tk.END, f"Container: {container_name}\n", 'title')
-                info_text.insert(tk.END, "=" * 80 + "\n\n")
-
-                # Basic Info Section
-                info_text.insert(tk.END, "\nBASIC INFORMATION\n", 'section')
-                ContainerManager._add_info_line(info_text, "ID", info.get('Id', 'N/A')[:12])
-                ContainerManager._add_info_line(info_text, "Name", info.get('Name', '').lstrip('/'))
-                ContainerManager._add_info_line(info_text, "Status", info.get('State', {}).get('Status', 'unknown'))
-                ContainerManager._add_info_line(info_text, "Image", info.get('Config', {}).get('Image', 'N/A'))
-                ContainerManager._add_info_line(info_text, "Created", info.get('Created', 'N/A'))
-                ContainerManager._add_info_line(info_text, "Platform", info.get('Platform', 'N/A'))
-                info_text.insert(tk.END, "\n")
-
-                # Network Info Section
-                info_text.insert(tk.END, "NETWORK INFORMATION\n", 'section')
-                networks = info.get('NetworkSettings', {}).get('Networks', {})
-                if networks:
-                    for net_name, net_info in networks.items():
-                        ContainerManager._add_info_line(info_text, f"Network", net_name)
-                        ContainerManager._add_info_line(info_text, f"  \u251c\u2500 IP Address", net_info.get('IPAddress', 'N/A'))
-                        ContainerManager._add_info_line(info_text, f"  \u251c\u2500 Gateway", net_info.get('Gateway', 'N/A'))
-                        ContainerManager._add_info_line(info_text, f"  \u2514\u2500 MAC Address", net_info.get('MacAddress', 'N/A'))
-                else:
-                    info_text.insert(tk.END, "  No networks attached\n")
-
-                # Port bindings
-                ports = info.get('NetworkSettings', {}).get('Ports', {})
-                if ports:
-                    info_text.insert(tk.END, "\n")
-                    ContainerManager._add_info_line(info_text, "Port Bindings", "")
-                    for container_port, host_bindings in ports.items():
-                        if host_bindings:
-                            for binding in host_bindings:
-                                ContainerManager._add_info_line(info_text, f"  {container_port}", f"{binding.get('HostIp', '0.0.0.0')}:{binding.get('HostPort', '')}")
-                info_text.insert(tk.END, "\n")
-
-                # Volumes Section
-                info_text.insert(tk.END, "VOLUMES\n", 'section')
-                mounts = info.get('Mounts', [])
-                if mounts:
-                    for mount in mounts:
-                        mount_type = mount.get('Type', 'N/A')
-                        source = mount.get('Source', 'N/A')
-                        destination = mount.get('Destination', 'N/A')
-                        ContainerManager._add_info_line(info_text, "Mount", f"{mount_type}")
-                        ContainerManager._add_info_line(info_text, "  \u251c\u2500 Source", source)
-                        ContainerManager._add_info_line(info_text, "  \u2514\u2500 Destination", destination)
-                else:
-                    info_text.insert(tk.END, "  No volumes mounted\n")
-                info_text.insert(tk.END, "\n")
-
-                # Environment Variables
-                info_text.insert(tk.END, "ENVIRONMENT VARIABLES\n", 'section')
-                env_vars = info.get('Config', {}).get('Env', [])
-                if env_vars:
-                    for env in env_vars[:10]:  # Limit to first 10
-                        info_text.insert(tk.END, f"  {env}\n", 'value')
-                    if len(env_vars) > 10:
-                        info_text.insert(tk.END, f"  ... and {len(env_vars) - 10} more\n", 'value')
-                else:
-                    info_text.insert(tk.END, "  No environment variables\n")
-
-                # Configure tags for styling
-                info_text.tag_config('title', foreground='#00ff88', font=('Segoe UI', 14, 'bold'))
-                info_text.tag_config('section', foreground='#00ADB5', font=('Segoe UI', 12, 'bold'))
-                info_text.tag_config('key', foreground='#FFD700', font=('Segoe UI', 10, 'bold'))
-                info_text.tag_config('value', foreground='#EEEEEE', font=('Segoe UI', 10))
+                # Text.insert accepts repeated "chars tagList" pairs in one command
+                info_text.insert(tk.END, *(part for segment in segments for part in segment))
 
                 info_text.config(state='disabled')
             except Exception as e:
-                logging.error(f"Error rendering container info: {e}")
+                log.error("Error rendering container info: %s", e)
                 ContainerManager._show_error(info_text, f"Error rendering container information: {e}")
 
         def _on_error(e):
-            logging.error(f"Error fetching container info: {e}")
+            log.error("Error fetching container info: %s", e)
             info_text.after(0, lambda: ContainerManager._show_error(info_text, f"Error loading container information: {e}"))
 
-        run_in_thread(_fetch, on_done=lambda info: _render_info(info), on_error=_on_error, tk_root=info_text)
+        def _fetch_segments():
+            info = _fetch()
+            return None if info is None else ContainerManager._build_info_segments(container_name, info)
+
+        # Only the widget update itself runs on the main thread
+        run_in_thread(_fetch_segments, on_done=_render_info, on_error=_on_error, tk_root=info_text)
+
+    @staticmethod
+    def _build_info_segments(container_name, info):
+        """Build the Info tab content as (text, tag) segments.
+        
+        Pure string work, so it runs on the fetch worker rather than the Tk
+        main thread.
+        
+        Args:
+            container_name: Name of the container
+            info: Container inspect attrs
+            
+        Returns:
+            List of (text, tag) tuples in display order
+        """
+        segments = []
+        add = segments.append
+        add_line = lambda key, value: segments.extend(((f"{key}: ", 'key'), (f"{value}\n", 'value')))
+
+        add((f"Container: {container_name}\n", 'title'))
+        add(("=" * 80 + "\n\n", ''))
+
+        # Basic Info Section
+        add(("\nBASIC INFORMATION\n", 'section'))
+        add_line("ID", info.get('Id', 'N/A')[:12])
+        add_line("Name", info.get('Name', '').lstrip('/'))
+        add_line("Status", info.get('State', {}).get('Status', 'unknown'))
+        add_line("Image", info.get('Config', {}).get('Image', 'N/A'))
+        add_line("Created", info.get('Created', 'N/A'))
+        add_line("Platform", info.get('Platform', 'N/A'))
+        add(("\n", ''))
+
+        # Network Info Section
+        add(("NETWORK INFORMATION\n", 'section'))
+        networks = info.get('NetworkSettings', {}).get('Networks', {})
+        if networks:
+            for net_name, net_info in networks.items():
+                add_line("Network", net_name)
+                add_line("  \u251c\u2500 IP Address", net_info.get('IPAddress', 'N/A'))
+                add_line("  \u251c\u2500 Gateway", net_info.get('Gateway', 'N/A'))
+                add_line("  \u2514\u2500 MAC Address", net_info.get('MacAddress', 'N/A'))
+        else:
+            add(("  No networks attached\n", ''))
+
+        # Port bindings
+        ports = info.get('NetworkSettings', {}).get('Ports', {})
+        if ports:
+            add(("\n", ''))
+            add_line("Port Bindings", "")
+            for container_port, host_bindings in ports.items():
+                if host_bindings:
+                    for binding in host_bindings:
+                        add_line(f"  {container_port}", f"{binding.get('HostIp', '0.0.0.0')}:{binding.get('HostPort', '')}")
+        add(("\n", ''))
+
+        # Volumes Section
+        add(("VOLUMES\n", 'section'))
+        mounts = info.get('Mounts', [])
+        if mounts:
+            for mount in mounts:
+                add_line("Mount", mount.get('Type', 'N/A'))
+                add_line("  \u251c\u2500 Source", mount.get('Source', 'N/A'))
+                add_line("  \u2514\u2500 Destination", mount.get('Destination', 'N/A'))
+        else:
+            add(("  No volumes mounted\n", ''))
+        add(("\n", ''))
+
+        # Environment Variables
+        add(("ENVIRONMENT VARIABLES\n", 'section'))
+        env_vars = info.get('Config', {}).get('Env', [])
+        if env_vars:
+            for env in env_vars[:10]:  # Limit to first 10
+                add((f"  {env}\n", 'value'))
+            if len(env_vars) > 10:
+                add((f"  ... and {len(env_vars) - 10} more\n", 'value'))
+        else:
+            add(("  No environment variables\n", ''))
+        return segments
 
     @staticmethod
     def _show_error(info_text, message):
@@ -394,16 +608,18 @@ class ContainerManager:
         info_text.insert(tk.END, f"Error: {message}\n")
         info_text.config(state='disabled')
     @staticmethod
-    def _add_info_line(info_text, key, value):
-        """Helper to add a key-value line to info text.
+    def _configure_info_tags(info_text):
+        """Configure the info text styling tags once per widget.
         
         Args:
             info_text: ScrolledText widget
-            key: Information key
-            value: Information value
         """
-        info_text.insert(tk.END, f"{key}: ", 'key')
-        info_text.insert(tk.END, f"{value}\n", 'value')
+        widget = str(info_text)
+        if widget in ContainerManager._info_tags_configured:
+            return
+        for tag, options in ContainerManager.INFO_TAGS.items():
+            info_text.tag_config(tag, **options)
+        ContainerManager._info_tags_configured.add(widget)
 
     @staticmethod
     def copy_container_id_to_clipboard(tree, clipboard_clear, clipboard_append, update_func, copy_tooltip):
@@ -423,6 +639,6 @@ class ContainerManager:
             clipboard_clear()
             clipboard_append(container_id)
             update_func()  # Required for clipboard to work
-            logging.info(f"Container ID copied to clipboard: {container_id}")
+            log.info("Container ID copied to clipboard: %s", container_id)
             # Show professional tooltip near cursor
             copy_tooltip.show(f"Copied: {container_id}")
@@ -4,35 +4,160 @@ Handles all image-related operations including listing, pulling, removing, and i
 """
 
 import logging
+import threading
+import time
 import tkinter as tk
 import json
-from tkinter import scrolledtext, messagebox
+from functools import lru_cache
+from tkinter import ttk, messagebox
 from docker_monitor.utils.docker_utils import client, docker_lock
 from docker_monitor.utils.docker_controller import get_docker_controller
 
 
 class ImageManager:
     """Manages Docker image operations and display."""
+
+    # Short IDs currently in the images tree and the values last written to each row,
+    # so refreshes can diff in Python instead of querying the widget
+    _tracked_ids = set()
+    _last_values = {}
+    # Snapshot of the last img_list applied; identical polls skip the tree entirely
+    _last_images_fingerprint = None
+
+    # Styling for the Info tab text tags
+    INFO_TAGS = {
+        'title': {'foreground': '#00ff88', 'font': ('Segoe UI', 14, 'bold')},
+        'section': {'foreground': '#00ADB5', 'font': ('Segoe UI', 12, 'bold')},
+        'key': {'foreground': '#FFD700', 'font': ('Segoe UI', 10, 'bold')},
+        'value': {'foreground': '#EEEEEE', 'font': ('Segoe UI', 10)},
+    }
+    # Widget paths whose INFO_TAGS are already configured
+    _info_tags_configured = set()
+
+    # How long inspect data may be reused between the Info tab and the inspect window
+    ATTRS_TTL = 10.0
+    # image id -> (monotonic timestamp, attrs); dropped when the image is changed
+    _attrs_cache = {}
+
+    # Seconds between reconnect attempts when the image events stream drops
+    EVENTS_RETRY_INTERVAL = 2.0
+    # Bumped by every image event and local image change; fetch_images reuses
+    # its last list while the revision is unchanged and the events stream is connected
+    _images_revision = 0
+    _images_cache = (None, [])
+    _events_live = False
+    _event_watch_started = False
+
+    # Characters of inspect JSON rendered per page in the inspect window
+    INSPECT_PAGE_CHARS = 65536
+
+    @staticmethod
+    def start_event_watch():
+        """Start the background thread that invalidates the image cache on Docker events.
+
+        Safe to call more than once; the thread is only started the first time.
+        """
+        if ImageManager._event_watch_started:
+            return
+        ImageManager._event_watch_started = True
+        threading.Thread(target=ImageManager._watch_image_events, daemon=True).start()
+
+    @staticmethod
+    def _watch_image_events():
+        """Subscribe to image events and invalidate cached image data for each one."""
+        while True:
+            try:
+                events = client.events(decode=True, filters={'type': 'image'})
+                # Anything may have changed while disconnected
+                ImageManager._invalidate()
+                ImageManager._events_live = True
+                for event in events:
+                    ImageManager._invalidate(event.get('id'))
+            except Exception as e:
+                logging.debug(f"Image events stream dropped: {e}")
+            # fetch_images lists directly until the stream reconnects
+            ImageManager._events_live = False
+            time.sleep(ImageManager.EVENTS_RETRY_INTERVAL)
+
+    @staticmethod
+    def _invalidate(image_id=None):
+        """Mark the image list stale and drop cached attrs for image_id (or all images)."""
+        ImageManager._images_revision += 1
+        if image_id is None:
+            ImageManager._attrs_cache.clear()
+        else:
+            ImageManager._attrs_cache.pop(image_id, None)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _fmt_size(size):
+        """Format a byte count the way the Info tab shows it (images often share sizes)."""
+        return f"{size / (1024**2):.2f} MB"
+
+    @staticmethod
+    def _next_json_page(chunks, limit=INSPECT_PAGE_CHARS):
+        """Pull up to limit characters from an iterencode generator.
+
+        Returns:
+            Tuple of (text, more) where more is True if the generator may have output left
+        """
+        buf = []
+        total = 0
+        for chunk in chunks:
+            buf.append(chunk)
+            total += len(chunk)
+            if total >= limit:
+                return ''.join(buf), True
+        return ''.join(buf), False
+
+    @staticmethod
+    def _get_image_attrs(image_id, ttl=ATTRS_TTL):
+        """Return inspect attrs for an image, reusing a cached copy younger than ttl."""
+        cached = ImageManager._attrs_cache.get(image_id)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        with docker_lock:
+            attrs = client.images.get(image_id).attrs
+        ImageManager._attrs_cache[image_id] = (time.monotonic(), attrs)
+        return attrs
     
     @staticmethod
-    def fetch_images():
+    def fetch_images(force=False):
         """Fetch all Docker images.
         
+        Args:
+            force: Re-list images even if the cached list is still current
+            
         Returns:
-            List of image dictionaries with id, repo_tags, size, and created
+            List of image dictionaries with id, repo_tags, repo_tags_csv, size
+            (bytes, int), created and search_blob
         """
+        # Read the revision before listing so an event that lands mid-list
+        # invalidates the result for the next call
+        revision = ImageManager._images_revision
+        cached_revision, cached = ImageManager._images_cache
+        if not force and ImageManager._events_live and cached_revision == revision:
+            return list(cached)
         with docker_lock:
             try:
-                images = client.images.list()
-                return [
-                    {
-                        'id': im.id,
-                        'repo_tags': im.tags,
-                        'size': f"{getattr(im, 'attrs', {}).get('Size', 0)}",
-                        'created': getattr(im, 'attrs', {}).get('Created', '')
-                    }
-                    for im in images
-                ]
+                # Low-level API: plain dicts from one /images/json call, no Image wrappers
+                raw = client.api.images(all=False)
+                images = []
+                for d in raw:
+                    # Same filtering as Image.tags
+                    tags = [t for t in (d.get('RepoTags') or []) if t != '<none>:<none>']
+                    tags_csv = ','.join(tags)
+                    images.append({
+                        'id': d['Id'],
+                        'repo_tags': tags,
+                        'repo_tags_csv': tags_csv,
+                        'size': d.get('Size', 0),
+                        'created': d.get('Created', ''),
+                        # Lowercased once here so filtering is a plain substring test
+                        'search_blob': (d['Id'] + '\0' + tags_csv).lower(),
+                    })
+                ImageManager._images_cache = (revision, images)
+                return list(images)
             except Exception as e:
                 logging.error(f"Error fetching images: {e}")
                 return []
@@ -56,6 +181,16 @@ class ImageManager:
             tree.tag_configure('evenrow', background=bg_color)
             tree_tags_configured = True
 
+        # Compared by value rather than by hash() so a collision can never hide a change
+        fingerprint = tuple(
+            (i['id'], i.get('size'), i.get('created'), tuple(i.get('repo_tags') or ()))
+            for i in img_list
+        )
+        if fingerprint == ImageManager._last_images_fingerprint:
+            # Steady state: nothing to write and the selection was never touched
+            return tree_tags_configured
+        ImageManager._last_images_fingerprint = fingerprint
+
         # Save current selection
         current_selection = tree.selection()
         selected_iid = current_selection[0] if current_selection else None
@@ -63,32 +198,56 @@ class ImageManager:
         # Use short IDs as unique identifiers
         current_short_ids = {i['id'][:12] for i in img_list}
         
-        # Batch delete using filter and map - faster than loop
-        to_delete = [child for child in tree.get_children() if child not in current_short_ids]
-        list(map(tree.delete, to_delete))
+        tracked_ids = ImageManager._tracked_ids
+        last_values = ImageManager._last_values
+
+        to_delete = tracked_ids - current_short_ids
+        rows_changed = bool(to_delete)
+        if to_delete:
+            # One Tcl call for the whole item list
+            tree.delete(*to_delete)
+            tracked_ids -= to_delete
+            for short_id in to_delete:
+                last_values.pop(short_id, None)
 
         # Prepare image data in batch
         image_updates = [
             (img['id'][:12], 
-             (img['id'][:12], ','.join(img.get('repo_tags') or []), 
-              img.get('size', ''), img.get('created', '')))
+             (img['id'][:12], img.get('repo_tags_csv') or ','.join(img.get('repo_tags') or []), 
+              ImageManager._fmt_size(img.get('size') or 0), img.get('created', '')))
             for img in img_list
         ]
         
-        # Apply updates/inserts
+        # Apply inserts and only the updates whose values changed. Call Tcl
+        # directly: Treeview.insert/item flatten an options dict on every row.
+        call = tree.tk.call
+        widget = tree._w
         for short_id, values in image_updates:
-            if tree.exists(short_id):
-                tree.item(short_id, values=values)
+            if short_id not in tracked_ids:
+                call(widget, 'insert', '', 'end', '-id', short_id, '-values', values)
+                tracked_ids.add(short_id)
+                rows_changed = True
+            elif last_values.get(short_id) == values:
+                continue
             else:
-                tree.insert('', tk.END, iid=short_id, values=values)
-
-        # Apply tags using map - faster than loop
-        children = tree.get_children()
-        list(map(lambda i_iid: tree.item(i_iid[1], tags=('evenrow' if i_iid[0] % 2 == 0 else 'oddrow',)), 
-                 enumerate(children)))
-        
-        # Restore selection if it still exists
-        if selected_iid and tree.exists(selected_iid):
+                call(widget, 'item', short_id, '-values', values)
+            last_values[short_id] = values
+
+        # Row parity only shifts when rows are added or removed; retag in bulk
+        # (tag remove without an item list clears the tag from every row)
+        if rows_changed:
+            # Reattach the rows in list order with one call; the order is then
+            # known here, so no get_children round-trip is needed for the tags
+            children = tuple(dict.fromkeys(short_id for short_id, _ in image_updates))
+            tree.set_children('', *children)
+            call(widget, 'tag', 'remove', 'evenrow')
+            call(widget, 'tag', 'remove', 'oddrow')
+            call(widget, 'tag', 'add', 'evenrow', children[0::2])
+            call(widget, 'tag', 'add', 'oddrow', children[1::2])
+        
+        # Restore selection only if the refresh actually dropped it: selection_set
+        # fires <<TreeviewSelect>>, which would re-render the Info tab for nothing
+        if selected_iid and selected_iid not in tree.selection() and tree.exists(selected_iid):
             tree.selection_set(selected_iid)
         
         return tree_tags_configured
@@ -107,11 +266,11 @@ class ImageManager:
         if not search_text:
             return all_images
         
-        search_text = search_text.lower()
+        q = search_text.lower()
         return [
             img for img in all_images
-            if search_text in img['id'].lower() or
-               search_text in ','.join(img.get('repo_tags', [])).lower()
+            if q in (img.get('search_blob')
+                     or (img['id'] + '\0' + ','.join(img.get('repo_tags') or [])).lower())
         ]
     
     @staticmethod
@@ -136,6 +295,7 @@ class ImageManager:
             with docker_lock:
                 client.images.remove(image_id, force=True)
             logging.info(f"Removed image {image_id}")
+            ImageManager._invalidate(image_id)
             success = True
         except Exception as e:
             error_msg = str(e)
@@ -178,6 +338,7 @@ class ImageManager:
                     repo, tag = new_tag, 'latest'
                 img.tag(repo, tag)
             logging.info(f"Tagged image {image_id} as {new_tag}")
+            ImageManager._invalidate(image_id)
             success = True
             if success_callback:
                 success_callback()
@@ -206,7 +367,7 @@ class ImageManager:
             success_callback: Function to call on success
         """
         # Use the process-backed worker to run heavy docker pulls in separate processes
-        from docker_monitor.utils.process_worker import run_docker_cmd_in_process
+        from docker_monitor.utils.process_worker import run_docker_cmd_once
 
         cmd = ['docker', 'pull', repo]
 
@@ -215,6 +376,7 @@ class ImageManager:
             stderr_tail = result.get('stderr_tail', '')
             if rc == 0:
                 logging.info(f'Pulled image {repo} (ok)')
+                ImageManager._invalidate()
                 if success_callback:
                     try:
                         success_callback()
@@ -227,7 +389,7 @@ class ImageManager:
             logging.exception(f'Error running docker pull for {repo}: {e}')
 
         # Schedule the docker pull in a separate process, marshal callbacks to the UI
-        run_docker_cmd_in_process(cmd, on_done=_on_done, on_error=_on_error, tk_root=None, block=False)
+        run_docker_cmd_once(cmd, on_done=_on_done, on_error=_on_error, tk_root=None, block=False)
     
     @staticmethod
     def prune_images(confirm_callback, status_callback):
@@ -252,6 +414,7 @@ class ImageManager:
                     count = len(deleted) if deleted else 0
                     space = result.get('SpaceReclaimed', 0)
                 
+                ImageManager._invalidate()
                 logging.info(f"✅ Pruned {count} images, reclaimed {space / (1024**2):.2f} MB")
                 if status_callback:
                     status_callback(f"✅ Pruned {count} images")
@@ -264,13 +427,14 @@ class ImageManager:
         run_in_thread(prune, on_done=None, on_error=lambda e: logging.error(f"Prune failed: {e}"), tk_root=None, block=True)
     
     @staticmethod
-    def remove_all_images(confirm_callback, status_callback, success_callback=None):
+    def remove_all_images(confirm_callback, status_callback, success_callback=None, tk_root=None):
         """Remove all images.
         
         Args:
             confirm_callback: Function to get confirmation
             status_callback: Function to update status
             success_callback: Function to call on success
+            tk_root: Widget used to run the callbacks on the Tk main thread (optional)
         """
         if not confirm_callback():
             return
@@ -279,31 +443,38 @@ class ImageManager:
         if status_callback:
             status_callback("🔄 Removing all images...")
         
-        def remove_all():
-            try:
-                with docker_lock:
-                    images = client.images.list()
-                
-                removed_count = 0
-                for img in images:
-                    try:
-                        client.images.remove(img.id, force=True)
-                        removed_count += 1
-                    except Exception as e:
-                        logging.debug(f"Could not remove image {img.short_id}: {e}")
-                
-                logging.info(f"✅ Removed {removed_count} images")
+        from docker_monitor.utils.process_worker import run_docker_cmd_once
+
+        # One batched CLI pipeline instead of an API DELETE per image. Multi-tagged
+        # images are listed once per tag, so dedupe them first. Up to 10 rmi batches
+        # run at once, so a parent can be tried before its child is gone; if any
+        # batch fails, one sequential pass over what is left clears those images.
+        cmd = ['bash', '-lc',
+               "docker images -q | awk '!seen[$0]++' | xargs -r -n 16 -P 10 docker rmi -f"
+               " || docker images -q | awk '!seen[$0]++' | xargs -r docker rmi -f"]
+
+        def _on_done(res):
+            ImageManager._invalidate()
+            rc = res.get('returncode', 255)
+            stderr = res.get('stderr_tail', '').strip()
+            if rc == 0:
+                logging.info("✅ Removed all images")
                 if status_callback:
-                    status_callback(f"✅ Removed {removed_count} images")
-                if success_callback:
-                    success_callback()
-            except Exception as e:
-                logging.error(f"❌ Error removing all images: {e}")
+                    status_callback("✅ Removed all images")
+            else:
+                # Images used by running containers cannot be removed; the rest still are
+                logging.warning(f"Some images could not be removed, rc={rc}: {stderr}")
                 if status_callback:
-                    status_callback(f"❌ Error removing images")
-        
-        from docker_monitor.utils.worker import run_in_thread
-        run_in_thread(remove_all, on_done=None, on_error=lambda e: logging.error(f"Remove all failed: {e}"), tk_root=None, block=True)
+                    status_callback("⚠️ Some images could not be removed")
+            if success_callback:
+                success_callback()
+
+        def _on_error(e):
+            logging.error(f"❌ Error removing all images: {e}")
+            if status_callback:
+                status_callback("❌ Error removing images")
+
+        run_docker_cmd_once(cmd, on_done=_on_done, on_error=_on_error, tk_root=tk_root, block=False)
 
     @staticmethod
     def show_image_inspect_modal(parent, image_id):
@@ -317,31 +488,66 @@ class ImageManager:
             frame = tk.Frame(win, padx=8, pady=8)
             frame.pack(fill=tk.BOTH, expand=True)
 
-            txt = scrolledtext.ScrolledText(frame, height=30, wrap=tk.NONE, bg='#ffffff', fg='#000000')
-            txt.pack(fill=tk.BOTH, expand=True)
+            # Plain Text + scrollbars: no ScrolledText wrapper and no undo bookkeeping
+            # on the (potentially multi-MB) inserts
+            text_frame = tk.Frame(frame)
+            text_frame.pack(fill=tk.BOTH, expand=True)
+            txt = tk.Text(text_frame, height=30, wrap=tk.NONE, bg='#ffffff', fg='#000000',
+                          undo=False, autoseparators=False, maxundo=0)
+            ysb = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=txt.yview)
+            xsb = ttk.Scrollbar(text_frame, orient=tk.HORIZONTAL, command=txt.xview)
+            txt.configure(yscrollcommand=ysb.set, xscrollcommand=xsb.set)
+            txt.grid(row=0, column=0, sticky='nsew')
+            ysb.grid(row=0, column=1, sticky='ns')
+            xsb.grid(row=1, column=0, sticky='ew')
+            text_frame.rowconfigure(0, weight=1)
+            text_frame.columnconfigure(0, weight=1)
             txt.insert(tk.END, "Loading image information...")
             txt.config(state='disabled')
 
-            btn = tk.Button(frame, text='Close', command=win.destroy)
-            btn.pack(pady=8)
+            btn_row = tk.Frame(frame)
+            btn_row.pack(pady=8)
+            more_btn = tk.Button(btn_row, text='Load More', state='disabled')
+            more_btn.pack(side=tk.LEFT, padx=4)
+            btn = tk.Button(btn_row, text='Close', command=win.destroy)
+            btn.pack(side=tk.LEFT, padx=4)
 
             # Fetch attrs in background
             from docker_monitor.utils.worker import run_in_thread
 
             def _fetch():
-                with docker_lock:
-                    image = client.images.get(image_id)
-                    return image.attrs
+                return ImageManager._get_image_attrs(image_id)
+
+            def _show_page(chunks):
+                # Render the next page, replacing the previous truncation note
+                text, more = ImageManager._next_json_page(chunks)
+                txt.config(state='normal')
+                ranges = txt.tag_ranges('truncated')
+                if ranges:
+                    txt.delete(ranges[0], ranges[-1])
+                if more:
+                    txt.insert(tk.END, text, (), '\n... (truncated, click Load More)', 'truncated')
+                else:
+                    txt.insert(tk.END, text)
+                txt.config(state='disabled')
+                more_btn.config(state='normal' if more else 'disabled')
 
             def _on_done(info):
                 try:
                     txt.config(state='normal')
                     txt.delete('1.0', tk.END)
+                    txt.config(state='disabled')
+                    # Encode lazily so large attrs never become one huge string
+                    chunks = json.JSONEncoder(indent=2).iterencode(info)
                     try:
-                        txt.insert(tk.END, json.dumps(info, indent=2))
+                        _show_page(chunks)
                     except Exception:
+                        txt.config(state='normal')
+                        txt.delete('1.0', tk.END)
                         txt.insert(tk.END, str(info))
-                    txt.config(state='disabled')
+                        txt.config(state='disabled')
+                        return
+                    more_btn.config(command=lambda: _show_page(chunks))
                 except Exception as e:
                     logging.error(f"Error rendering inspect modal: {e}")
                     messagebox.showerror('Error', f'Failed to render image info: {e}')
@@ -373,77 +579,80 @@ class ImageManager:
         from docker_monitor.utils.worker import run_in_thread
 
         def _fetch():
+            info = ImageManager._get_image_attrs(image_id)
+            # Also resolved here so the render step makes no API calls on the Tk thread
             with docker_lock:
-                image = client.images.get(image_id)
-                return image.attrs
+                containers = client.containers.list(all=True, filters={'ancestor': image_id})
+            return info, [(c.name, c.status) for c in containers]
 
-        def _render_info(info):
+        def _render_info(result):
             try:
-                info_text.config(state='normal')
-                info_text.delete('1.0', tk.END)
+                info, containers = result
+                # Collect (text, tag) segments and hand them to Tk in a single insert
+                segments = []
+                add = segments.append
+                add_line = lambda key, value: segments.extend(((f"  {key}: ", ''), (f"{value}\n", 'value')))
 
                 # Title
                 tags = info.get('RepoTags', ['<none>'])
-                info_text.insert(tk.END, f"Image: {tags[0] if tags else '<none>'}\n", 'title')
-                info_text.insert(tk.END, "=" * 80 + "\n\n")
+                add((f"Image: {tags[0] if tags else '<none>'}\n", 'title'))
+                add(("=" * 80 + "\n\n", ''))
 
                 # Basic Info
-                info_text.insert(tk.END, "BASIC INFORMATION\n", 'section')
-                ImageManager._add_info_line(info_text, "ID", info.get('Id', 'N/A').replace('sha256:', '')[:12])
-                ImageManager._add_info_line(info_text, "Tags", ', '.join(info.get('RepoTags', ['<none>'])))
-                ImageManager._add_info_line(info_text, "Size", f"{info.get('Size', 0) / (1024**2):.2f} MB")
-                ImageManager._add_info_line(info_text, "Created", info.get('Created', 'N/A'))
-                ImageManager._add_info_line(info_text, "Architecture", info.get('Architecture', 'N/A'))
-                ImageManager._add_info_line(info_text, "OS", info.get('Os', 'N/A'))
-                info_text.insert(tk.END, "\n")
+                add(("BASIC INFORMATION\n", 'section'))
+                add_line("ID", info.get('Id', 'N/A').replace('sha256:', '')[:12])
+                add_line("Tags", ', '.join(info.get('RepoTags', ['<none>'])))
+                add_line("Size", f"{info.get('Size', 0) / (1024**2):.2f} MB")
+                add_line("Created", info.get('Created', 'N/A'))
+                add_line("Architecture", info.get('Architecture', 'N/A'))
+                add_line("OS", info.get('Os', 'N/A'))
+                add(("\n", ''))
 
                 # Container Config
-                info_text.insert(tk.END, "CONTAINER CONFIGURATION\n", 'section')
+                add(("CONTAINER CONFIGURATION\n", 'section'))
                 config = info.get('Config', {})
-                ImageManager._add_info_line(info_text, "User", config.get('User', 'root') or 'root')
-                ImageManager._add_info_line(info_text, "Working Dir", config.get('WorkingDir', '/') or '/')
+                add_line("User", config.get('User', 'root') or 'root')
+                add_line("Working Dir", config.get('WorkingDir', '/') or '/')
 
                 # Exposed Ports
                 exposed = config.get('ExposedPorts', {})
                 if exposed:
-                    ImageManager._add_info_line(info_text, "Exposed Ports", ', '.join(exposed.keys()))
+                    add_line("Exposed Ports", ', '.join(exposed.keys()))
 
                 # Entrypoint and CMD
                 entrypoint = config.get('Entrypoint', [])
                 if entrypoint:
-                    ImageManager._add_info_line(info_text, "Entrypoint", ' '.join(entrypoint))
+                    add_line("Entrypoint", ' '.join(entrypoint))
                 cmd = config.get('Cmd', [])
                 if cmd:
-                    ImageManager._add_info_line(info_text, "Cmd", ' '.join(cmd))
-                info_text.insert(tk.END, "\n")
+                    add_line("Cmd", ' '.join(cmd))
+                add(("\n", ''))
 
                 # Environment
-                info_text.insert(tk.END, "ENVIRONMENT\n", 'section')
+                add(("ENVIRONMENT\n", 'section'))
                 env = config.get('Env', [])
                 if env:
                     for e in env[:10]:
-                        info_text.insert(tk.END, f"  {e}\n")
+                        add((f"  {e}\n", ''))
                     if len(env) > 10:
-                        info_text.insert(tk.END, f"  ... and {len(env) - 10} more\n")
+                        add((f"  ... and {len(env) - 10} more\n", ''))
                 else:
-                    info_text.insert(tk.END, "  No environment variables\n")
-                info_text.insert(tk.END, "\n")
+                    add(("  No environment variables\n", ''))
+                add(("\n", ''))
 
                 # Containers using this image
-                info_text.insert(tk.END, "CONTAINERS USING THIS IMAGE\n", 'section')
-                with docker_lock:
-                    containers = client.containers.list(all=True, filters={'ancestor': image_id})
+                add(("CONTAINERS USING THIS IMAGE\n", 'section'))
                 if containers:
-                    for container in containers:
-                        ImageManager._add_info_line(info_text, container.name, container.status)
+                    for name, status in containers:
+                        add_line(name, status)
                 else:
-                    info_text.insert(tk.END, "  No containers using this image\n")
+                    add(("  No containers using this image\n", ''))
 
-                # Configure tags
-                info_text.tag_config('title', foreground='#00ff88', font=('Segoe UI', 14, 'bold'))
-                info_text.tag_config('section', foreground='#00ADB5', font=('Segoe UI', 12, 'bold'))
-                info_text.tag_config('key', foreground='#FFD700', font=('Segoe UI', 10, 'bold'))
-                info_text.tag_config('value', foreground='#EEEEEE', font=('Segoe UI', 10))
+                ImageManager._configure_info_tags(info_text)
+                info_text.config(state='normal')
+                info_text.delete('1.0', tk.END)
+                # Text.insert accepts repeated "chars tagList" pairs in one command
+                info_text.insert(tk.END, *(part for segment in segments for part in segment))
 
                 info_text.config(state='disabled')
             except Exception as e:
@@ -454,7 +663,7 @@ class ImageManager:
             logging.error(f"Error fetching image info: {e}")
             info_text.after(0, lambda: ImageManager._show_error(info_text, f"Error loading image information: {e}"))
 
-        run_in_thread(_fetch, on_done=lambda info: _render_info(info), on_error=_on_error, tk_root=info_text)
+        run_in_thread(_fetch, on_done=_render_info, on_error=_on_error, tk_root=info_text)
 
     @staticmethod
     def _show_error(info_text, message):
@@ -464,21 +673,19 @@ class ImageManager:
         info_text.config(state='disabled')
         
     @staticmethod
-    def _add_info_line(info_text, key, value):
-        """Insert a single labeled info line into the info_text widget.
+    def _configure_info_tags(info_text):
+        """Configure the info text styling tags once per widget.
 
         Args:
-            info_text: scrolledtext widget to write into
-            key: label/key string
-            value: value string
+            info_text: scrolledtext widget to style
         """
-        try:
-            info_text.insert(tk.END, f"  {key}: ")
-            info_text.insert(tk.END, f"{value}\n", 'value')
-        except Exception as e:
-            logging.debug(f"Failed to add info line {key}: {e}")
-        
-    
+        widget = str(info_text)
+        if widget in ImageManager._info_tags_configured:
+            return
+        for tag, options in ImageManager.INFO_TAGS.items():
+            info_text.tag_config(tag, **options)
+        ImageManager._info_tags_configured.add(widget)
+
     @staticmethod
     def copy_image_id_to_clipboard(tree, clipboard_clear, clipboard_append, update_func, copy_tooltip):
         """Copy image ID to clipboard on double-click.
@@ -294,46 +294,52 @@ class NetworkManager:
             if not info:
                 raise Exception("Failed to retrieve network information")
             
-            # Clear existing content
-            info_text.config(state='normal')
-            info_text.delete('1.0', tk.END)
+            # Collect (text, tag) segments and hand them to Tk in a single insert
+            segments = []
+            add = segments.append
+            add_line = lambda key, value: segments.extend(((f"{key}: ", 'key'), (f"{value}\n", 'value')))
             
             # Title
-            info_text.insert(tk.END, f"Network: {network_name}\n", 'title')
-            info_text.insert(tk.END, "=" * 80 + "\n\n")
+            add((f"Network: {network_name}\n", 'title'))
+            add(("=" * 80 + "\n\n", ''))
             
             # Basic Info
-            info_text.insert(tk.END, "🌐 BASIC INFORMATION\n", 'section')
-            NetworkManager._add_info_line(info_text, "ID", info.get('Id', 'N/A')[:12])
-            NetworkManager._add_info_line(info_text, "Name", info.get('Name', 'N/A'))
-            NetworkManager._add_info_line(info_text, "Driver", info.get('Driver', 'N/A'))
-            NetworkManager._add_info_line(info_text, "Scope", info.get('Scope', 'N/A'))
-            NetworkManager._add_info_line(info_text, "Internal", str(info.get('Internal', False)))
-            NetworkManager._add_info_line(info_text, "Attachable", str(info.get('Attachable', False)))
-            info_text.insert(tk.END, "\n")
+            add(("🌐 BASIC INFORMATION\n", 'section'))
+            add_line("ID", info.get('Id', 'N/A')[:12])
+            add_line("Name", info.get('Name', 'N/A'))
+            add_line("Driver", info.get('Driver', 'N/A'))
+            add_line("Scope", info.get('Scope', 'N/A'))
+            add_line("Internal", str(info.get('Internal', False)))
+            add_line("Attachable", str(info.get('Attachable', False)))
+            add(("\n", ''))
             
             # IPAM Configuration
-            info_text.insert(tk.END, "📊 IPAM CONFIGURATION\n", 'section')
+            add(("📊 IPAM CONFIGURATION\n", 'section'))
             ipam = info.get('IPAM', {})
             ipam_config = ipam.get('Config', [])
             if ipam_config:
                 for config in ipam_config:
-                    NetworkManager._add_info_line(info_text, "  Subnet", config.get('Subnet', 'N/A'))
-                    NetworkManager._add_info_line(info_text, "  Gateway", config.get('Gateway', 'N/A'))
+                    add_line("  Subnet", config.get('Subnet', 'N/A'))
+                    add_line("  Gateway", config.get('Gateway', 'N/A'))
             else:
-                info_text.insert(tk.END, "  No IPAM configuration\n")
-            info_text.insert(tk.END, "\n")
+                add(("  No IPAM configuration\n", ''))
+            add(("\n", ''))
             
             # Connected Containers
-            info_text.insert(tk.END, "🐳 CONNECTED CONTAINERS\n", 'section')
+            add(("🐳 CONNECTED CONTAINERS\n", 'section'))
             containers = info.get('Containers', {})
             if containers:
                 for container_id, container_info in containers.items():
-                    NetworkManager._add_info_line(info_text, "Container", container_info.get('Name', 'Unknown'))
-                    NetworkManager._add_info_line(info_text, "  ├─ IP Address", container_info.get('IPv4Address', 'N/A'))
-                    NetworkManager._add_info_line(info_text, "  └─ MAC Address", container_info.get('MacAddress', 'N/A'))
+                    add_line("Container", container_info.get('Name', 'Unknown'))
+                    add_line("  ├─ IP Address", container_info.get('IPv4Address', 'N/A'))
+                    add_line("  └─ MAC Address", container_info.get('MacAddress', 'N/A'))
             else:
-                info_text.insert(tk.END, "  No containers connected\n")
+                add(("  No containers connected\n", ''))
+            
+            info_text.config(state='normal')
+            info_text.delete('1.0', tk.END)
+            # Text.insert accepts repeated "chars tagList" pairs in one command
+            info_text.insert(tk.END, *(part for segment in segments for part in segment))
             
             # Configure tags
             info_text.tag_config('title', foreground='#00ff88', font=('Segoe UI', 14, 'bold'))
@@ -351,12 +357,6 @@ class NetworkManager:
             info_text.tag_config('error', foreground='#e74c3c', font=('Segoe UI', 11))
             info_text.config(state='disabled')
     
-    @staticmethod
-    def _add_info_line(info_text, key, value):
-        """Helper to add a key-value line to info text."""
-        info_text.insert(tk.END, f"{key}: ", 'key')
-        info_text.insert(tk.END, f"{value}\n", 'value')
-    
     @staticmethod
     def copy_network_id_to_clipboard(tree, clipboard_clear, clipboard_append, update_func, copy_tooltip):
         """Copy network ID to clipboard on double-click.
@@ -7,125 +7,79 @@ responsive. UI updates are scheduled back onto the Tk mainloop via
 """
 
 import logging
+from functools import partial
 from tkinter import messagebox
 from typing import Callable
 
-from docker_monitor.utils.process_worker import run_docker_cmd_in_process
+from docker_monitor.utils.process_worker import run_docker_cmd_once
 
 
 class PruneManager:
+    # kind -> (confirm prompt, command, success status, failure status prefix, log label).
+    # Commands are tuples built once at import and double as the in-flight dedup key.
+    _CMDS = {
+        'containers': (
+            'Remove all stopped containers?',
+            ('docker', 'container', 'prune', '--force'),
+            '✅ Container prune completed', '❌ Prune failed', 'Container prune',
+        ),
+        'images': (
+            'Remove all unused images?',
+            ('docker', 'image', 'prune', '--all', '--force'),
+            '✅ Image prune completed', '❌ Prune failed', 'Image prune',
+        ),
+        'networks': (
+            'Remove all unused networks?',
+            ('docker', 'network', 'prune', '--force'),
+            '✅ Network prune completed', '❌ Prune failed', 'Network prune',
+        ),
+        'stopped_containers': (
+            'Remove ALL stopped containers?\nThis action cannot be undone.',
+            ('bash', '-lc', "docker ps -a -f 'status=exited' -q | xargs -r docker rm -v"),
+            '✅ Removed stopped containers', '❌ Remove failed', 'Remove stopped containers',
+        ),
+    }
+
     @staticmethod
-    def prune_containers(status_bar, refresh_callback: Callable[[], None]):
-        if not messagebox.askyesno('Confirm', 'Remove all stopped containers?'):
+    def _run(prompt, cmd, success_text, fail_prefix, label, status_bar, refresh_callback: Callable[[], None]):
+        """Confirm, then run cmd in a process and report the outcome on the status bar."""
+        if not messagebox.askyesno('Confirm', prompt):
             return
 
-        cmd = ['docker', 'container', 'prune', '--force']
-
         def _on_done(res):
             rc = res.get('returncode', 255)
             stderr = res.get('stderr_tail', '').strip()
             if rc == 0:
                 try:
-                    status_bar.after(0, lambda: status_bar.config(text='✅ Container prune completed'))
+                    status_bar.after(0, partial(status_bar.config, text=success_text))
                     status_bar.after(0, refresh_callback)
                 except Exception:
-                    logging.exception('Failed to update UI after prune_containers')
+                    logging.exception(f'Failed to update UI after {label.lower()}')
             else:
-                logging.error(f'Container prune failed, rc={rc}: {stderr}')
+                logging.error(f'{label} failed, rc={rc}: {stderr}')
                 try:
-                    status_bar.after(0, lambda: status_bar.config(text=f'❌ Prune failed: {stderr[:200]}'))
+                    status_bar.after(0, partial(status_bar.config, text=f'{fail_prefix}: {stderr[:200]}'))
                 except Exception:
                     logging.exception('Failed to update UI on prune error')
 
         def _on_error(e):
-            logging.exception('Error running container prune')
+            logging.exception(f'Error running {label.lower()}')
 
-        logging.info('Scheduling container prune in process')
-        run_docker_cmd_in_process(cmd, on_done=_on_done, on_error=_on_error, tk_root=status_bar, block=False)
+        logging.info(f'Scheduling {label.lower()} in process')
+        run_docker_cmd_once(cmd, on_done=_on_done, on_error=_on_error, tk_root=status_bar, block=False)
 
     @staticmethod
-    def prune_images(status_bar, refresh_callback: Callable[[], None]):
-        if not messagebox.askyesno('Confirm', 'Remove all unused images?'):
-            return
-
-        cmd = ['docker', 'image', 'prune', '--all', '--force']
-
-        def _on_done(res):
-            rc = res.get('returncode', 255)
-            stderr = res.get('stderr_tail', '').strip()
-            if rc == 0:
-                try:
-                    status_bar.after(0, lambda: status_bar.config(text='✅ Image prune completed'))
-                    status_bar.after(0, refresh_callback)
-                except Exception:
-                    logging.exception('Failed to update UI after prune_images')
-            else:
-                logging.error(f'Image prune failed, rc={rc}: {stderr}')
-                try:
-                    status_bar.after(0, lambda: status_bar.config(text=f'❌ Prune failed: {stderr[:200]}'))
-                except Exception:
-                    logging.exception('Failed to update UI on prune error')
-
-        def _on_error(e):
-            logging.exception('Error running image prune')
+    def prune_containers(status_bar, refresh_callback: Callable[[], None]):
+        PruneManager._run(*PruneManager._CMDS['containers'], status_bar, refresh_callback)
 
-        logging.info('Scheduling image prune in process')
-        run_docker_cmd_in_process(cmd, on_done=_on_done, on_error=_on_error, tk_root=status_bar, block=False)
+    @staticmethod
+    def prune_images(status_bar, refresh_callback: Callable[[], None]):
+        PruneManager._run(*PruneManager._CMDS['images'], status_bar, refresh_callback)
 
     @staticmethod
     def prune_networks(status_bar, refresh_callback: Callable[[], None]):
-        if not messagebox.askyesno('Confirm', 'Remove all unused networks?'):
-            return
-
-        cmd = ['docker', 'network', 'prune', '--force']
-
-        def _on_done(res):
-            rc = res.get('returncode', 255)
-            stderr = res.get('stderr_tail', '').strip()
-            if rc == 0:
-                try:
-                    status_bar.after(0, lambda: status_bar.config(text='✅ Network prune completed'))
-                    status_bar.after(0, refresh_callback)
-                except Exception:
-                    logging.exception('Failed to update UI after prune_networks')
-            else:
-                logging.error(f'Network prune failed, rc={rc}: {stderr}')
-                try:
-                    status_bar.after(0, lambda: status_bar.config(text=f'❌ Prune failed: {stderr[:200]}'))
-                except Exception:
-                    logging.exception('Failed to update UI on prune error')
-
-        def _on_error(e):
-            logging.exception('Error running network prune')
-
-        logging.info('Scheduling network prune in process')
-        run_docker_cmd_in_process(cmd, on_done=_on_done, on_error=_on_error, tk_root=status_bar, block=False)
+        PruneManager._run(*PruneManager._CMDS['networks'], status_bar, refresh_callback)
 
     @staticmethod
     def remove_all_stopped_containers(status_bar, refresh_callback: Callable[[], None]):
-        if not messagebox.askyesno('Confirm', 'Remove ALL stopped containers?\nThis action cannot be undone.'):
-            return
-
-        cmd = ['bash', '-lc', "docker ps -a -f 'status=exited' -q | xargs -r docker rm -v"]
-
-        def _on_done(res):
-            rc = res.get('returncode', 255)
-            stderr = res.get('stderr_tail', '').strip()
-            if rc == 0:
-                try:
-                    status_bar.after(0, lambda: status_bar.config(text='✅ Removed stopped containers'))
-                    status_bar.after(0, refresh_callback)
-                except Exception:
-                    logging.exception('Failed to update UI after remove_all_stopped_containers')
-            else:
-                logging.error(f'Remove stopped containers failed, rc={rc}: {stderr}')
-                try:
-                    status_bar.after(0, lambda: status_bar.config(text=f'❌ Remove failed: {stderr[:200]}'))
-                except Exception:
-                    logging.exception('Failed to update UI on prune error')
-
-        def _on_error(e):
-            logging.exception('Error removing stopped containers')
-
-        logging.info('Scheduling remove_all_stopped_containers in process')
-        run_docker_cmd_in_process(cmd, on_done=_on_done, on_error=_on_error, tk_root=status_bar, block=False)
+        PruneManager._run(*PruneManager._CMDS['stopped_containers'], status_bar, refresh_callback)
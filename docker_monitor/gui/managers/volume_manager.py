@@ -5,100 +5,299 @@ Handles all Docker volume-related operations.
 
 import json
 import logging
+import threading
+import time
 import tkinter as tk
+from bisect import bisect_right
+from concurrent.futures import Future
+from functools import lru_cache
 from tkinter import scrolledtext, messagebox, simpledialog
 
-from docker_monitor.utils.docker_utils import client, docker_lock
+from docker_monitor.utils.docker_utils import client, docker_lock, docker_sem
 from docker_monitor.utils.docker_controller import get_docker_controller
 from docker_monitor.utils.worker import run_in_thread
+from docker_monitor.gui.widgets.confirm_dialog import ConfirmDialog
+
+try:
+    # Optional C-backed serializer; the stdlib encoder is used when it is missing
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
+def _dumps_attrs(attrs):
+    """Pretty-print inspect attrs as JSON, stringifying anything not JSON-native."""
+    if orjson is not None:
+        return orjson.dumps(attrs, default=str, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(attrs, indent=2, default=str)
+
+
+# Controller singleton, looked up once instead of on every create/remove
+_controller = None
+
+
+def _get_ctrl():
+    global _controller
+    if _controller is None:
+        _controller = get_docker_controller()
+    return _controller
+
+
+def reset_controller_cache():
+    """Forget the cached controller so the next action looks it up again."""
+    global _controller
+    _controller = None
+
+
+@lru_cache(maxsize=1024)
+def _fmt_label_items(items):
+    # Docker label keys and values are always strings, so each pair joins directly
+    return ','.join(map('='.join, items))
+
+
+def _fmt_labels(labels):
+    """Render a volume's labels as 'k=v,...' (many volumes share the same labels)."""
+    return _fmt_label_items(tuple(labels.items())) if labels else ''
 
 
 class VolumeManager:
     """Manager class for Docker volume operations."""
+
+    # Volume name -> (values, parity tag) last written to the volumes tree
+    _row_cache = {}
+    # Row list of the last update_volumes_tree call
+    _last_volume_updates = None
+    # Rows inserted per Tk event-loop slice, so thousands of new volumes
+    # don't freeze the UI while they are materialized
+    INSERT_CHUNK = 500
+    _render_gen = 0
+    # Last filter run: narrowing the query re-filters 'result' instead of 'all'
+    _filter_cache = {'all': None, 'query': '', 'result': None}
+    # Lists longer than this are filtered via one joined search string
+    BLOB_FILTER_MIN = 1000
+    # (volume list it was built from, joined lowercase fields, start offset of each row)
+    _search_blob = (None, '', [])
+
+    # Single-flight state for fetch_volumes
+    _fetch_lock = threading.Lock()
+    _fetch_in_progress = None
+
+    # How long the volume -> containers mount index may be reused across Info tab clicks
+    MOUNTS_INDEX_TTL = 2.0
+    # (monotonic timestamp, {volume name: [(container name, destination), ...]})
+    _mounts_index = (0.0, {})
+
+    @staticmethod
+    def _get_mounts_index():
+        """Return which containers mount each named volume, rebuilt at most once per TTL."""
+        ts, index = VolumeManager._mounts_index
+        if time.monotonic() - ts < VolumeManager.MOUNTS_INDEX_TTL:
+            return index
+        index = {}
+        # One /containers/json call; its summaries already carry the mounts
+        for c in client.api.containers(all=True):
+            name = (c.get('Names') or ['/'])[0].lstrip('/')
+            for mount in c.get('Mounts') or []:
+                if mount.get('Type') == 'volume':
+                    index.setdefault(mount.get('Name'), []).append((name, mount.get('Destination', 'N/A')))
+        VolumeManager._mounts_index = (time.monotonic(), index)
+        return index
     
     @staticmethod
     def fetch_volumes():
-        """Fetch all volumes from Docker."""
-        with docker_lock:
-            vols = client.volumes.list()
-            vol_list = []
-            for vol in vols:
-                attrs = getattr(vol, 'attrs', {})
-                vol_list.append({
-                    'Name': vol.name,
-                    'Driver': attrs.get('Driver', ''),
-                    'Mountpoint': attrs.get('Mountpoint', ''),
-                    'Labels': attrs.get('Labels', {})
-                })
+        """Fetch all volumes from Docker.
+
+        Calls that arrive while a fetch is already running wait for it and
+        share its result instead of listing again.
+        """
+        with VolumeManager._fetch_lock:
+            fut = VolumeManager._fetch_in_progress
+            owner = fut is None or fut.done()
+            if owner:
+                fut = VolumeManager._fetch_in_progress = Future()
+        if not owner:
+            return fut.result()
+
+        try:
+            with docker_sem:
+                vols = client.volumes.list()
+                vol_list = [VolumeManager._volume_dict(vol.name, getattr(vol, 'attrs', {})) for vol in vols]
+        except BaseException as e:
+            # Waiters must never be left blocked on an unfinished future
+            fut.set_exception(e)
+            raise
+        fut.set_result(vol_list)
         return vol_list
+
+    @staticmethod
+    def _volume_dict(name, attrs):
+        """Build the dict used for one volume throughout the UI from its inspect attrs."""
+        driver = attrs.get('Driver', '')
+        mountpoint = attrs.get('Mountpoint', '')
+        labels = attrs.get('Labels', {})
+        return {
+            'Name': name,
+            'Driver': driver,
+            'Mountpoint': mountpoint,
+            'Labels': labels,
+            # Lowercased search fields, computed once per fetch instead of per keystroke
+            '_lc': (name.lower(), driver.lower(), mountpoint.lower()),
+            # Labels column text, so tree refreshes don't format it again
+            '_labels_str': _fmt_labels(labels),
+        }
     
     @staticmethod
-    def update_volumes_tree(volumes_tree, vol_list, tags_configured, bg_color, frame_bg):
-        """Update the volumes tree widget with volume data."""
-        if not tags_configured:
-            volumes_tree.tag_configure('oddrow', background=frame_bg)
-            volumes_tree.tag_configure('evenrow', background=bg_color)
-            tags_configured = True
-
-        # Save current selection
-        current_selection = volumes_tree.selection()
-        selected_iid = current_selection[0] if current_selection else None
-
-        current_names = {v['Name'] for v in vol_list}
-        
-        # Batch delete using filter and map
-        to_delete = [child for child in volumes_tree.get_children() 
-                    if volumes_tree.item(child)['values'][0] not in current_names]
-        list(map(volumes_tree.delete, to_delete))
+    def update_volumes_tree(volumes_tree, vol_list):
+        """Update the volumes tree widget with volume data.
+
+        The 'oddrow'/'evenrow' tags are configured where the tree is created.
+        """
+        # Selection is left alone: rows are never recreated or detached here, so a
+        # selected row keeps its selection, and one that was deleted cannot be
+        # restored. (Re-selecting would also fire <<TreeviewSelect>> every refresh.)
 
         # Prepare volume data in batch
         volume_updates = [
             (v['Name'],
              (v['Name'], v.get('Driver', ''), v.get('Mountpoint', ''),
-              ','.join([f"{k}={v}" for k, v in (v.get('Labels') or {}).items()]) if v.get('Labels') else ''))
+              v['_labels_str'] if '_labels_str' in v else _fmt_labels(v.get('Labels'))))
             for v in vol_list
         ]
-        
-        # Apply updates/inserts
-        for iid, values in volume_updates:
-            if volumes_tree.exists(iid):
-                volumes_tree.item(iid, values=values)
+        # Identical polls (the common case) skip the diff entirely
+        if volume_updates == VolumeManager._last_volume_updates:
+            return
+        VolumeManager._last_volume_updates = volume_updates
+        # Invalidates insert batches still queued by an earlier call
+        VolumeManager._render_gen += 1
+
+        # iid -> (values, parity tag), in list order; tags are assigned inline
+        new_rows = {
+            iid: (values, 'oddrow' if i & 1 else 'evenrow')
+            for i, (iid, values) in enumerate(volume_updates)
+        }
+
+        row_cache = VolumeManager._row_cache
+        to_delete = row_cache.keys() - new_rows.keys()
+        rows_changed = bool(to_delete)
+        if to_delete:
+            # One Tcl call for the whole item list
+            try:
+                volumes_tree.delete(*to_delete)
+            except tk.TclError:
+                # Some row is already gone (Tk rejects the whole call); delete the rest one by one
+                for iid in to_delete:
+                    if volumes_tree.exists(iid):
+                        volumes_tree.delete(iid)
+            for iid in to_delete:
+                del row_cache[iid]
+
+        # Only rows that are new or whose values/parity changed touch Tcl
+        call = volumes_tree.tk.call
+        widget = volumes_tree._w
+        to_insert = []
+        for iid, row in new_rows.items():
+            cached = row_cache.get(iid)
+            if cached is None:
+                to_insert.append((iid, row))
+                continue
+            elif cached == row:
+                continue
             else:
-                volumes_tree.insert('', tk.END, iid=iid, values=values)
+                if cached[1] != row[1]:
+                    # Parity shifted by an insert/delete above
+                    call(widget, 'item', iid, '-tags', row[1])
+                if cached[0] != row[0]:
+                    changed = [(col, new) for col, (old, new) in enumerate(zip(cached[0], row[0])) if old != new]
+                    if len(changed) < len(row[0]):
+                        # Rewrite only the cells that differ (columns by index)
+                        for col, new in changed:
+                            call(widget, 'set', iid, col, new)
+                    else:
+                        call(widget, 'item', iid, '-values', row[0])
+            row_cache[iid] = row
 
-        # Apply tags using map - faster than loop
-        children = volumes_tree.get_children()
-        list(map(lambda i_iid: volumes_tree.item(i_iid[1], tags=('evenrow' if i_iid[0] % 2 == 0 else 'oddrow',)), 
-                 enumerate(children)))
-        
-        # Restore selection if it still exists
-        if selected_iid and volumes_tree.exists(selected_iid):
-            volumes_tree.selection_set(selected_iid)
-        
-        return tags_configured
+        if to_insert or rows_changed:
+            VolumeManager._insert_rows(volumes_tree, to_insert, tuple(new_rows), VolumeManager._render_gen)
+
+    @staticmethod
+    def _insert_rows(volumes_tree, rows, order, gen):
+        """Insert rows INSERT_CHUNK at a time, yielding to the event loop in between.
+
+        Once every row is in, the children are put back in list order. A newer
+        update_volumes_tree call (gen mismatch) takes over any rows not yet inserted.
+        """
+        if gen != VolumeManager._render_gen:
+            return
+        call = volumes_tree.tk.call
+        widget = volumes_tree._w
+        row_cache = VolumeManager._row_cache
+        chunk = VolumeManager.INSERT_CHUNK
+        for iid, row in rows[:chunk]:
+            call(widget, 'insert', '', 'end', '-id', iid, '-values', row[0], '-tags', row[1])
+            row_cache[iid] = row
+        if len(rows) > chunk:
+            volumes_tree.after(1, VolumeManager._insert_rows, volumes_tree, rows[chunk:], order, gen)
+            return
+        # New rows were appended at the end; put everything back in list order
+        volumes_tree.set_children('', *order)
     
     @staticmethod
-    def filter_volumes(volumes_tree, all_volumes, search_var, bg_color, frame_bg):
+    def filter_volumes(volumes_tree, all_volumes, search_var):
         """Filter volumes based on search query."""
         search_text = search_var.get().lower()
         if not search_text:
             # Show all volumes
-            VolumeManager.update_volumes_tree(
-                volumes_tree, all_volumes, True, bg_color, frame_bg
-            )
+            VolumeManager.update_volumes_tree(volumes_tree, all_volumes)
             return
         
+        # A query that extends the previous one can only match a subset of its result
+        cache = VolumeManager._filter_cache
+        if (cache['all'] is all_volumes and cache['result'] is not None
+                and search_text.startswith(cache['query'])):
+            source = cache['result']
+        else:
+            source = all_volumes
+
         # Filter volumes
-        filtered = [
-            v for v in all_volumes
-            if search_text in v['Name'].lower() or
-               search_text in v.get('Driver', '').lower() or
-               search_text in v.get('Mountpoint', '').lower()
-        ]
-        VolumeManager.update_volumes_tree(
-            volumes_tree, filtered, True, bg_color, frame_bg
-        )
+        if source is all_volumes and len(source) > VolumeManager.BLOB_FILTER_MIN and not ('\n' in search_text or '\0' in search_text):
+            filtered = VolumeManager._blob_filter(all_volumes, search_text)
+        else:
+            filtered = [
+                v for v in source
+                if any(search_text in field for field in v['_lc'])
+            ]
+        cache.update({'all': all_volumes, 'query': search_text, 'result': filtered})
+        VolumeManager.update_volumes_tree(volumes_tree, filtered)
     
+    @staticmethod
+    def _blob_filter(all_volumes, search_text):
+        """Substring-filter a large volume list by scanning one joined string with str.find.
+
+        Each volume's lowercased fields form one line of the blob, so the scan runs
+        in C and only matching rows cost any Python work.
+        """
+        src, blob, starts = VolumeManager._search_blob
+        if src is not all_volumes:
+            lines = ['\0'.join(v['_lc']) for v in all_volumes]
+            starts = []
+            pos = 0
+            for line in lines:
+                starts.append(pos)
+                pos += len(line) + 1
+            blob = '\n'.join(lines)
+            VolumeManager._search_blob = (all_volumes, blob, starts)
+
+        filtered = []
+        find = blob.find
+        last = len(starts) - 1
+        pos = find(search_text)
+        while pos != -1:
+            row = bisect_right(starts, pos) - 1
+            filtered.append(all_volumes[row])
+            # One hit per row is enough; resume at the next line
+            pos = find(search_text, starts[row + 1]) if row < last else -1
+        return filtered
+
     @staticmethod
     def create_volume(name_callback, driver_callback, success_callback, tk_root=None):
         """Create a new Docker volume.
@@ -106,7 +305,8 @@ class VolumeManager:
         Args:
             name_callback: Function to get volume name from user
             driver_callback: Function to get driver from user
-            success_callback: Function to call on success
+            success_callback: Function to call on success (optional; the controller
+                cache is already patched and observers notified)
         """
         name = name_callback()
         if not name:
@@ -116,13 +316,13 @@ class VolumeManager:
         if not driver:
             driver = 'local'  # Default driver
         
-        controller = get_docker_controller()
+        controller = _get_ctrl()
         def _create():
             success = False
             error_msg = None
             try:
-                with docker_lock:
-                    client.volumes.create(name=name, driver=driver)
+                with docker_sem:
+                    vol = client.volumes.create(name=name, driver=driver)
                 logging.info(f'✅ Created volume {name} with driver {driver}')
                 success = True
             except Exception as exc:
@@ -131,9 +331,9 @@ class VolumeManager:
 
             controller.notify_volume_action('create', name, success, error_msg)
 
-            if success:
-                vol_list = VolumeManager.fetch_volumes()
-                controller.update_volumes(vol_list)
+            # Patch the cached list with the new volume; re-list only if there is nothing to patch
+            if success and not controller.add_volume(VolumeManager._volume_dict(vol.name, vol.attrs)):
+                controller.update_volumes(VolumeManager.fetch_volumes())
 
             return success, error_msg
 
@@ -155,17 +355,23 @@ class VolumeManager:
     
     @staticmethod
     def remove_volume(name, update_callback, tk_root=None):
-        """Remove a volume."""
-        confirm = messagebox.askyesno('Confirm Remove', f'Remove volume {name}?')
-        if not confirm:
+        """Remove a volume after a (non-blocking, when tk_root is given) confirmation."""
+        if tk_root is None:
+            if messagebox.askyesno('Confirm Remove', f'Remove volume {name}?'):
+                VolumeManager._remove_confirmed(name, update_callback, tk_root)
             return
-        
-        controller = get_docker_controller()
+        ConfirmDialog(tk_root, 'Confirm Remove', f'Remove volume {name}?',
+                      on_yes=lambda: VolumeManager._remove_confirmed(name, update_callback, tk_root))
+
+    @staticmethod
+    def _remove_confirmed(name, update_callback, tk_root):
+        """Run the removal of a confirmed volume in a worker."""
+        controller = _get_ctrl()
         def _remove():
             success = False
             error_msg = None
             try:
-                with docker_lock:
+                with docker_sem:
                     vol = client.volumes.get(name)
                     vol.remove()
                 logging.info(f'✅ Removed volume {name}')
@@ -176,16 +382,16 @@ class VolumeManager:
 
             controller.notify_volume_action('remove', name, success, error_msg)
 
-            if success:
-                vol_list = VolumeManager.fetch_volumes()
-                controller.update_volumes(vol_list)
+            if success and not controller.remove_volume_local(name):
+                controller.update_volumes(VolumeManager.fetch_volumes())
 
             return success, error_msg
 
         def _after_remove(result):
             success, error_msg = result
             if success:
-                update_callback()
+                if update_callback:
+                    update_callback()
             else:
                 messagebox.showerror('Error', f'Failed to remove volume: {error_msg}')
 
@@ -199,39 +405,38 @@ class VolumeManager:
     
     @staticmethod
     def prune_volumes(refresh_callback, status_bar):
-        """Remove unused volumes."""
-        confirm = messagebox.askyesno(
+        """Remove unused volumes after a non-blocking confirmation."""
+        ConfirmDialog(
+            status_bar.winfo_toplevel(),
             '⚠️  Confirm Volume Prune', 
             'This will permanently delete all unused volumes!\n'
-            'Data cannot be recovered. Continue?'
+            'Data cannot be recovered. Continue?',
+            on_yes=lambda: VolumeManager._prune_confirmed(refresh_callback, status_bar)
         )
-        if not confirm:
-            return
-        
+
+    @staticmethod
+    def _prune_confirmed(refresh_callback, status_bar):
+        """Run a confirmed volume prune in a worker."""
         logging.info("🧹 Pruning unused volumes...")
         
         def prune():
             try:
                 with docker_lock:
                     result = client.volumes.prune()
-                count = len(result.get('VolumesDeleted', []))
+                count = len(result.get('VolumesDeleted') or [])
                 status_bar.after(0, lambda: logging.info(f"✅ Removed {count} volumes"))
                 status_bar.after(0, status_bar.config, {"text": f"✅ Removed {count} volumes"})
                 status_bar.after(0, refresh_callback)
             except Exception as e:
                 status_bar.after(0, lambda err=e: logging.error(f"❌ Error: {err}"))
         
-        from docker_monitor.utils.worker import run_in_thread
-        run_in_thread(prune, on_done=None, on_error=lambda e: status_bar.after(0, lambda: logging.error(f"Prune failed: {e}")), tk_root=None, block=True)
+        # Results are marshalled through status_bar.after, so there is no need to block the UI
+        run_in_thread(prune, on_done=None, on_error=lambda e: status_bar.after(0, lambda: logging.error(f"Prune failed: {e}")), tk_root=None, block=False)
     
     @staticmethod
     def show_volume_inspect_modal(parent, name):
         """Show detailed inspect information for a volume in a modal window."""
         try:
-            with docker_lock:
-                vol = client.volumes.get(name)
-                attrs = vol.attrs
-            
             win = tk.Toplevel(parent)
             win.title(f'Volume: {name}')
             win.geometry('800x600')
@@ -245,17 +450,34 @@ class VolumeManager:
                 selectforeground='#ffffff'
             )
             txt.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-            
-            try:
-                txt.insert(tk.END, json.dumps(attrs, indent=2))
-            except Exception:
-                txt.insert(tk.END, str(attrs))
-            
+            txt.insert(tk.END, "Loading volume information...")
             txt.config(state='disabled')
-            
         except Exception as e:
             logging.error(f'❌ Error inspecting volume {name}: {e}')
             messagebox.showerror('Error', f'Failed to inspect volume: {str(e)}')
+            return
+
+        # Fetch and serialize off the Tk thread; only the insert happens in the callback
+        def _fetch():
+            with docker_sem:
+                attrs = client.volumes.get(name).attrs
+            return _dumps_attrs(attrs)
+
+        def _fill(text):
+            try:
+                txt.config(state='normal')
+                txt.delete('1.0', tk.END)
+                txt.insert('1.0', text)
+                txt.config(state='disabled')
+            except tk.TclError:
+                # Window was closed before the data arrived
+                pass
+
+        def _on_error(e):
+            logging.error(f'❌ Error inspecting volume {name}: {e}')
+            _fill(f"Error loading volume information: {e}")
+
+        run_in_thread(_fetch, on_done=_fill, on_error=_on_error, tk_root=parent, block=False)
     
     @staticmethod
     def run_volume_action(volumes_tree, action, update_callback, parent):
@@ -298,68 +520,64 @@ class VolumeManager:
         from docker_monitor.utils.worker import run_in_thread
 
         def _fetch():
-            with docker_lock:
+            with docker_sem:
                 volume = client.volumes.get(volume_name)
-                return volume.attrs
+                attrs = volume.attrs
+            return attrs, VolumeManager._get_mounts_index().get(volume_name, [])
 
-        def _render_info(info):
+        def _render_info(result):
+            info, using_containers = result
             try:
-                info_text.config(state='normal')
-                info_text.delete('1.0', tk.END)
+                # Collect (text, tag) segments and hand them to Tk in a single insert
+                segments = []
+                add = segments.append
+                add_line = lambda key, value: segments.extend(((f"  {key}: ", 'key'), (f"{value}\n", 'value')))
 
                 # Title
-                info_text.insert(tk.END, f"Volume: {volume_name}\n", 'title')
-                info_text.insert(tk.END, "=" * 80 + "\n\n")
+                add((f"Volume: {volume_name}\n", 'title'))
+                add(("=" * 80 + "\n\n", ''))
 
                 # Basic Info
-                info_text.insert(tk.END, "BASIC INFORMATION\n", 'section')
-                VolumeManager._add_info_line(info_text, "Name", info.get('Name', 'N/A'))
-                VolumeManager._add_info_line(info_text, "Driver", info.get('Driver', 'N/A'))
-                VolumeManager._add_info_line(info_text, "Mountpoint", info.get('Mountpoint', 'N/A'))
-                VolumeManager._add_info_line(info_text, "Created", info.get('CreatedAt', 'N/A'))
-                VolumeManager._add_info_line(info_text, "Scope", info.get('Scope', 'N/A'))
-                info_text.insert(tk.END, "\n")
+                add(("BASIC INFORMATION\n", 'section'))
+                add_line("Name", info.get('Name', 'N/A'))
+                add_line("Driver", info.get('Driver', 'N/A'))
+                add_line("Mountpoint", info.get('Mountpoint', 'N/A'))
+                add_line("Created", info.get('CreatedAt', 'N/A'))
+                add_line("Scope", info.get('Scope', 'N/A'))
+                add(("\n", ''))
 
                 # Labels
-                info_text.insert(tk.END, "LABELS\n", 'section')
+                add(("LABELS\n", 'section'))
                 labels = info.get('Labels', {})
                 if labels:
                     for key, value in labels.items():
-                        VolumeManager._add_info_line(info_text, key, value)
+                        add_line(key, value)
                 else:
-                    info_text.insert(tk.END, "  No labels\n")
-                info_text.insert(tk.END, "\n")
+                    add(("  No labels\n", ''))
+                add(("\n", ''))
 
                 # Options
-                info_text.insert(tk.END, "OPTIONS\n", 'section')
+                add(("OPTIONS\n", 'section'))
                 options = info.get('Options', {})
                 if options:
                     for key, value in options.items():
-                        VolumeManager._add_info_line(info_text, key, str(value))
+                        add_line(key, str(value))
                 else:
-                    info_text.insert(tk.END, "  No options\n")
-                info_text.insert(tk.END, "\n")
+                    add(("  No options\n", ''))
+                add(("\n", ''))
 
                 # Containers using this volume
-                info_text.insert(tk.END, "CONTAINERS USING THIS VOLUME\n", 'section')
-                with docker_lock:
-                    containers = client.containers.list(all=True)
-                using_containers = []
-                for container in containers:
-                    mounts = container.attrs.get('Mounts', [])
-                    for mount in mounts:
-                        if mount.get('Type') == 'volume' and mount.get('Name') == volume_name:
-                            using_containers.append({
-                                'name': container.name,
-                                'destination': mount.get('Destination', 'N/A')
-                            })
-
+                add(("CONTAINERS USING THIS VOLUME\n", 'section'))
                 if using_containers:
-                    for c in using_containers:
-                        VolumeManager._add_info_line(info_text, c['name'], f"mounted at {c['destination']}")
+                    for name, destination in using_containers:
+                        add_line(name, f"mounted at {destination}")
                 else:
-                    info_text.insert(tk.END, "  No containers using this volume\n")
+                    add(("  No containers using this volume\n", ''))
 
+                info_text.config(state='normal')
+                info_text.delete('1.0', tk.END)
+                # Text.insert accepts repeated "chars tagList" pairs in one command
+                info_text.insert(tk.END, *(part for segment in segments for part in segment))
                 info_text.config(state='disabled')
             except Exception as e:
                 VolumeManager._show_info_error(info_text, f"Error rendering volume info: {str(e)}")
@@ -368,21 +586,14 @@ class VolumeManager:
             logging.error(f"Error fetching volume info: {e}")
             info_text.after(0, lambda: VolumeManager._show_info_error(info_text, f"Error fetching volume info: {str(e)}"))
 
-        run_in_thread(_fetch, on_done=lambda info: _render_info(info), on_error=_on_error, tk_root=info_text)
-    
-    @staticmethod
-    def _add_info_line(info_text, key, value):
-        """Helper to add a formatted key-value line to info text."""
-        info_text.insert(tk.END, f"  {key}: ", 'key')
-        info_text.insert(tk.END, f"{value}\n", 'value')
+        run_in_thread(_fetch, on_done=_render_info, on_error=_on_error, tk_root=info_text)
     
     @staticmethod
     def _show_info_error(info_text, message):
         """Display an error message in the info tab."""
         info_text.config(state='normal')
         info_text.delete('1.0', tk.END)
-        info_text.insert(tk.END, "⚠️ ERROR\n", 'title')
-        info_text.insert(tk.END, f"\n{message}\n", 'warning')
+        info_text.insert(tk.END, "⚠️ ERROR\n", 'title', f"\n{message}\n", 'warning')
         info_text.config(state='disabled')
     
     @staticmethod
@@ -0,0 +1,52 @@
+import tkinter as tk
+
+
+class ConfirmDialog:
+    """A non-modal Yes/No confirmation that reports the answer through callbacks.
+
+    Unlike messagebox.askyesno it does not block the caller, so the main loop
+    keeps running worker callbacks while the user decides.
+    """
+
+    def __init__(self, parent, title, message, on_yes, on_no=None):
+        self.on_yes = on_yes
+        self.on_no = on_no
+
+        self.win = tk.Toplevel(parent)
+        self.win.title(title)
+        self.win.transient(parent)
+        self.win.resizable(False, False)
+        self.win.configure(bg='#222831')
+
+        tk.Label(
+            self.win,
+            text=message,
+            bg='#222831',
+            fg='#EEEEEE',
+            font=('Segoe UI', 10),
+            justify=tk.LEFT,
+            padx=20,
+            pady=15
+        ).pack()
+
+        buttons = tk.Frame(self.win, bg='#222831')
+        buttons.pack(pady=(0, 12))
+        yes_btn = tk.Button(buttons, text='Yes', width=8, command=lambda: self._answer(True))
+        yes_btn.pack(side=tk.LEFT, padx=6)
+        tk.Button(buttons, text='No', width=8, command=lambda: self._answer(False)).pack(side=tk.LEFT, padx=6)
+
+        # Closing the window counts as "No"
+        self.win.protocol('WM_DELETE_WINDOW', lambda: self._answer(False))
+        self.win.bind('<Return>', lambda e: self._answer(True))
+        self.win.bind('<Escape>', lambda e: self._answer(False))
+
+        # Place it over the parent window
+        self.win.geometry(f"+{parent.winfo_rootx() + 80}+{parent.winfo_rooty() + 80}")
+        yes_btn.focus_set()
+
+    def _answer(self, yes):
+        """Close the dialog and run the matching callback."""
+        self.win.destroy()
+        callback = self.on_yes if yes else self.on_no
+        if callback:
+            callback()
@@ -57,7 +57,6 @@ class UIComponents:
             font=('Segoe UI', 10, 'bold'),
             relief='flat')
         app_instance.style.map("Treeview.Heading", background=[('active', app_instance.ACCENT_COLOR)])
-        app_instance.tree_tags_configured = False # To set up alternating row colors only once
 
         # --- Notebook Tab Styling ---
         app_instance.style.configure('TNotebook', background=app_instance.BG_COLOR, borderwidth=0, tabmargins=[0, 0, 0, 0])
@@ -4,11 +4,25 @@ Central controller that manages Docker data and notifies observers of changes.
 Implements the Observer pattern Subject role.
 """
 
+import json
 import logging
 import threading
-from typing import List, Dict, Any, Optional
+from collections import deque
+from typing import List, Dict, Any, Optional, Tuple
 from docker_monitor.utils.observer import Subject
 
+try:
+    # Optional: vectorizes metrics for large fleets; pure Python is used without it
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None
+
+try:
+    # Optional C-backed serializer for snapshot bytes; stdlib json is used without it
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 
 class DockerDataController(Subject):
     """
@@ -19,48 +33,101 @@ class DockerDataController(Subject):
     decoupling data fetching from UI updates.
     
     Event Types:
-        - 'containers_updated': Container list or stats changed
+        - 'containers_updated': Container list or stats changed (with added/removed/changed IDs)
         - 'networks_updated': Network list changed
         - 'images_updated': Image list changed
         - 'volumes_updated': Volume list changed
-        - 'docker_event': Real-time Docker event occurred
+        - 'docker_events_batch': Real-time Docker events, coalesced into one list per burst
         - 'container_action': Container action completed (start, stop, etc.)
         - 'network_action': Network action completed
         - 'image_action': Image action completed
         - 'volume_action': Volume action completed
     """
     
-    _instance = None
-    _lock = threading.Lock()
-    
-    def __new__(cls):
-        """Singleton pattern to ensure only one controller instance exists."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
+    # Recycle action payload dicts after observers return. Only safe while every
+    # observer consumes 'data' synchronously; turn off for observers that keep it.
+    POOL_ACTION_PAYLOADS = True
+    # Running-container count from which metrics use NumPy (when installed)
+    NUMPY_METRICS_MIN = 64
+    # Seconds Docker events are collected before one batched notification goes out
+    EVENT_BATCH_DELAY = 0.016
     
     def __init__(self):
-        """Initialize the controller."""
-        # Only initialize once (singleton)
-        if not hasattr(self, '_initialized'):
-            super().__init__()
-            self._initialized = True
-            
-            # Cache for Docker data
-            self._containers_cache: List[Dict[str, Any]] = []
-            self._networks_cache: List[Dict[str, Any]] = []
-            self._images_cache: List[Dict[str, Any]] = []
-            self._volumes_cache: List[Dict[str, Any]] = []
-            
-            # Thread-safe locks for cache access
-            self._containers_lock = threading.Lock()
-            self._networks_lock = threading.Lock()
-            self._images_lock = threading.Lock()
-            self._volumes_lock = threading.Lock()
-            
-            logging.info("DockerDataController initialized")
+        """Initialize the controller. Use get_docker_controller() for the shared instance."""
+        super().__init__()
+        
+        # Cache for Docker data
+        self._containers_cache: Tuple[Dict[str, Any], ...] = ()
+        self._networks_cache: Tuple[Dict[str, Any], ...] = ()
+        self._images_cache: Tuple[Dict[str, Any], ...] = ()
+        self._volumes_cache: Tuple[Dict[str, Any], ...] = ()
+        
+        # Lookup indexes rebuilt whenever a cache is published, so find_*
+        # are hash lookups instead of scans
+        self._containers_index: tuple = ({}, {}, {})  # (by id, by name, by status)
+        self._networks_by_name: Dict[str, Dict[str, Any]] = {}
+        self._images_by_tag: Dict[str, Dict[str, Any]] = {}
+        self._volumes_by_name: Dict[str, Dict[str, Any]] = {}
+        
+        # kind -> (cache list, lowercased haystack per item), built on first search
+        self._search_blobs: Dict[str, tuple] = {}
+        # (containers list, metrics) from the last compute_resource_metrics call
+        self._metrics_memo: tuple = (None, None)
+        # (caches + observer count it was built from, serialized snapshot)
+        self._snapshot_bytes_memo: tuple = (None, b'')
+        # Spare action payload dicts (deque append/pop are thread-safe)
+        self._action_dict_pool: deque = deque(maxlen=128)
+        
+        # Values of the last published container list; an identical poll is not re-sent
+        self._containers_fingerprint: Optional[tuple] = None
+        
+        # Docker events waiting for the next batched flush
+        self._pending_events: List[Dict[str, Any]] = []
+        self._events_lock = threading.Lock()
+        self._events_flush_scheduled = False
+        
+        # Caches are published by rebinding the attribute to a new tuple
+        # (atomic under the GIL) and can't be mutated in place, so readers
+        # take a snapshot reference without locking. Writers serialize on this
+        # one lock, which also makes multi-cache updates and snapshots atomic.
+        self._cache_lock = threading.Lock()
+        
+        logging.info("DockerDataController initialized")
+    
+    # === Cache Publication ===
+    
+    def _set_containers(self, containers: List[Dict[str, Any]]) -> None:
+        by_id, by_name, by_status = {}, {}, {}
+        for c in containers:
+            by_id.setdefault(c.get('id', ''), c)
+            by_name.setdefault(c.get('name'), c)
+            by_status.setdefault(c.get('status'), []).append(c)
+        # One tuple, so readers never pair indexes from different updates
+        self._containers_index = (by_id, by_name, by_status)
+        self._containers_cache = tuple(containers)
+        self._containers_fingerprint = None
+    
+    def _set_networks(self, networks: List[Dict[str, Any]]) -> None:
+        by_name = {}
+        for n in networks:
+            by_name.setdefault(n.get('name'), n)
+        self._networks_by_name = by_name
+        self._networks_cache = tuple(networks)
+    
+    def _set_images(self, images: List[Dict[str, Any]]) -> None:
+        by_tag = {}
+        for img in images:
+            for tag in img.get('repo_tags') or ():
+                by_tag.setdefault(tag, img)
+        self._images_by_tag = by_tag
+        self._images_cache = tuple(images)
+    
+    def _set_volumes(self, volumes: List[Dict[str, Any]]) -> None:
+        by_name = {}
+        for v in volumes:
+            by_name.setdefault(v.get('Name'), v)
+        self._volumes_by_name = by_name
+        self._volumes_cache = tuple(volumes)
     
     # === Container Methods ===
     
@@ -68,6 +135,11 @@ class DockerDataController(Subject):
         """
         Update container data and notify observers.
         
+        A list with the same values as the last one published is ignored, so idle
+        polls don't make observers redraw. Otherwise the notification carries the
+        full list as 'data' plus 'added', 'removed' and 'changed' container IDs,
+        so observers can limit their work to the delta.
+        
         Args:
             containers_data: List of container stats dictionaries
         """
@@ -79,21 +151,39 @@ class DockerDataController(Subject):
             logging.error(f"update_containers expected list, got {type(containers_data)}")
             return
         
-        with self._containers_lock:
-            self._containers_cache = containers_data
-        
-        self.notifyObservers('containers_updated', data=containers_data)
+        fingerprint = tuple(tuple(c.values()) for c in containers_data)
+        with self._cache_lock:
+            if fingerprint == self._containers_fingerprint:
+                logging.debug("Container data unchanged; skipping notification")
+                return
+            old_by_id = self._containers_index[0]
+            self._set_containers(containers_data)
+            self._containers_fingerprint = fingerprint
+            new_by_id = self._containers_index[0]
+        
+        added = [cid for cid in new_by_id if cid not in old_by_id]
+        removed = [cid for cid in old_by_id if cid not in new_by_id]
+        changed = [
+            cid for cid, c in new_by_id.items()
+            if cid in old_by_id and old_by_id[cid] != c
+        ]
+        self.notifyObservers(
+            'containers_updated',
+            data=containers_data,
+            added=added,
+            removed=removed,
+            changed=changed
+        )
         logging.debug(f"Container data updated: {len(containers_data)} containers")
     
-    def get_containers(self) -> List[Dict[str, Any]]:
+    def get_containers(self) -> Tuple[Dict[str, Any], ...]:
         """
         Get cached container data.
         
         Returns:
-            List of container stats dictionaries
+            Tuple of container stats dictionaries (immutable snapshot; list() it to modify)
         """
-        with self._containers_lock:
-            return self._containers_cache.copy()
+        return self._containers_cache
     
     def notify_container_action(self, action: str, container_name: str, 
                                 success: bool = True, error: Optional[str] = None) -> None:
@@ -106,15 +196,7 @@ class DockerDataController(Subject):
             success: Whether the action succeeded
             error: Error message if action failed
         """
-        self.notifyObservers(
-            'container_action',
-            data={
-                'action': action,
-                'container_name': container_name,
-                'success': success,
-                'error': error
-            }
-        )
+        self._notify_action('container_action', 'container_name', action, container_name, success, error)
     
     # === Network Methods ===
     
@@ -133,21 +215,20 @@ class DockerDataController(Subject):
             logging.error(f"update_networks expected list, got {type(networks_data)}")
             return
         
-        with self._networks_lock:
-            self._networks_cache = networks_data
+        with self._cache_lock:
+            self._set_networks(networks_data)
         
         self.notifyObservers('networks_updated', data=networks_data)
         logging.debug(f"Network data updated: {len(networks_data)} networks")
     
-    def get_networks(self) -> List[Dict[str, Any]]:
+    def get_networks(self) -> Tuple[Dict[str, Any], ...]:
         """
         Get cached network data.
         
         Returns:
-            List of network dictionaries
+            Tuple of network dictionaries (immutable snapshot; list() it to modify)
         """
-        with self._networks_lock:
-            return self._networks_cache.copy()
+        return self._networks_cache
     
     def notify_network_action(self, action: str, network_name: str,
                              success: bool = True, error: Optional[str] = None) -> None:
@@ -160,15 +241,7 @@ class DockerDataController(Subject):
             success: Whether the action succeeded
             error: Error message if action failed
         """
-        self.notifyObservers(
-            'network_action',
-            data={
-                'action': action,
-                'network_name': network_name,
-                'success': success,
-                'error': error
-            }
-        )
+        self._notify_action('network_action', 'network_name', action, network_name, success, error)
     
     # === Image Methods ===
     
@@ -187,21 +260,20 @@ class DockerDataController(Subject):
             logging.error(f"update_images expected list, got {type(images_data)}")
             return
         
-        with self._images_lock:
-            self._images_cache = images_data
+        with self._cache_lock:
+            self._set_images(images_data)
         
         self.notifyObservers('images_updated', data=images_data)
         logging.debug(f"Image data updated: {len(images_data)} images")
     
-    def get_images(self) -> List[Dict[str, Any]]:
+    def get_images(self) -> Tuple[Dict[str, Any], ...]:
         """
         Get cached image data.
         
         Returns:
-            List of image dictionaries
+            Tuple of image dictionaries (immutable snapshot; list() it to modify)
         """
-        with self._images_lock:
-            return self._images_cache.copy()
+        return self._images_cache
     
     def notify_image_action(self, action: str, image_id: str,
                            success: bool = True, error: Optional[str] = None) -> None:
@@ -214,15 +286,7 @@ class DockerDataController(Subject):
             success: Whether the action succeeded
             error: Error message if action failed
         """
-        self.notifyObservers(
-            'image_action',
-            data={
-                'action': action,
-                'image_id': image_id,
-                'success': success,
-                'error': error
-            }
-        )
+        self._notify_action('image_action', 'image_id', action, image_id, success, error)
     
     # === Volume Methods ===
     
@@ -241,21 +305,63 @@ class DockerDataController(Subject):
             logging.error(f"update_volumes expected list, got {type(volumes_data)}")
             return
         
-        with self._volumes_lock:
-            self._volumes_cache = volumes_data
+        with self._cache_lock:
+            self._set_volumes(volumes_data)
         
         self.notifyObservers('volumes_updated', data=volumes_data)
         logging.debug(f"Volume data updated: {len(volumes_data)} volumes")
     
-    def get_volumes(self) -> List[Dict[str, Any]]:
+    def get_volumes(self) -> Tuple[Dict[str, Any], ...]:
         """
         Get cached volume data.
         
         Returns:
-            List of volume dictionaries
+            Tuple of volume dictionaries (immutable snapshot; list() it to modify)
+        """
+        return self._volumes_cache
+    
+    def add_volume(self, volume: Dict[str, Any]) -> bool:
         """
-        with self._volumes_lock:
-            return self._volumes_cache.copy()
+        Add (or replace) a single volume in the cache and notify observers.
+        
+        Args:
+            volume: Volume dictionary as produced by VolumeManager.fetch_volumes
+            
+        Returns:
+            False if there is no cached list to patch; the caller should do a full update_volumes
+        """
+        with self._cache_lock:
+            if not self._volumes_cache:
+                return False
+            name = volume.get('Name')
+            # New list object, so consumers holding the old one see the change
+            volumes = [v for v in self._volumes_cache if v.get('Name') != name]
+            volumes.append(volume)
+            self._set_volumes(volumes)
+        
+        self.notifyObservers('volumes_updated', data=volumes)
+        logging.debug(f"Volume added to cache: {name}")
+        return True
+    
+    def remove_volume_local(self, volume_name: str) -> bool:
+        """
+        Drop a single volume from the cache and notify observers.
+        
+        Args:
+            volume_name: Name of the removed volume
+            
+        Returns:
+            False if the volume was not cached; the caller should do a full update_volumes
+        """
+        with self._cache_lock:
+            volumes = [v for v in self._volumes_cache if v.get('Name') != volume_name]
+            if len(volumes) == len(self._volumes_cache):
+                return False
+            self._set_volumes(volumes)
+        
+        self.notifyObservers('volumes_updated', data=volumes)
+        logging.debug(f"Volume removed from cache: {volume_name}")
+        return True
     
     def notify_volume_action(self, action: str, volume_name: str,
                             success: bool = True, error: Optional[str] = None) -> None:
@@ -268,40 +374,67 @@ class DockerDataController(Subject):
             success: Whether the action succeeded
             error: Error message if action failed
         """
-        self.notifyObservers(
-            'volume_action',
-            data={
-                'action': action,
-                'volume_name': volume_name,
-                'success': success,
-                'error': error
-            }
-        )
+        self._notify_action('volume_action', 'volume_name', action, volume_name, success, error)
+    
+    def _notify_action(self, event_type: str, target_key: str, action: str, target: str,
+                       success: bool, error: Optional[str]) -> None:
+        """Send an action payload to observers, reusing a pooled dict when enabled."""
+        pool = self._action_dict_pool
+        try:
+            payload = pool.pop()
+        except IndexError:
+            payload = {}
+        payload['action'] = action
+        payload[target_key] = target
+        payload['success'] = success
+        payload['error'] = error
+        self.notifyObservers(event_type, data=payload)
+        if self.POOL_ACTION_PAYLOADS:
+            payload.clear()
+            pool.append(payload)
     
     # === Docker Event Methods ===
     
     def notify_docker_event(self, event: Dict[str, Any]) -> None:
         """
-        Notify observers of a real-time Docker event.
+        Queue a real-time Docker event for observers.
+        
+        Events arriving within EVENT_BATCH_DELAY of each other (e.g. the burst
+        from one container restart) go out as a single 'docker_events_batch'.
         
         Args:
             event: Docker event dictionary
         """
-        self.notifyObservers('docker_event', data=event)
         logging.debug(f"Docker event: {event.get('Action')} on {event.get('Type')}")
+        with self._events_lock:
+            self._pending_events.append(event)
+            if self._events_flush_scheduled:
+                return
+            self._events_flush_scheduled = True
+        
+        timer = threading.Timer(self.EVENT_BATCH_DELAY, self._flush_docker_events)
+        timer.daemon = True
+        timer.start()
+    
+    def _flush_docker_events(self) -> None:
+        """Send all queued Docker events to observers in one notification."""
+        with self._events_lock:
+            events = self._pending_events
+            self._pending_events = []
+            self._events_flush_scheduled = False
+        
+        if events:
+            self.notifyObservers('docker_events_batch', data=events)
     
     # === Utility Methods ===
     
     def clear_all_caches(self) -> None:
         """Clear all cached data."""
-        with self._containers_lock:
-            self._containers_cache = []
-        with self._networks_lock:
-            self._networks_cache = []
-        with self._images_lock:
-            self._images_cache = []
-        with self._volumes_lock:
-            self._volumes_cache = []
+        with self._cache_lock:
+            self._set_containers([])
+            self._set_networks([])
+            self._set_images([])
+            self._set_volumes([])
         
         logging.info("All Docker data caches cleared")
     
@@ -330,7 +463,8 @@ class DockerDataController(Subject):
         Batch update multiple resource types at once with a single notification.
         
         This is faster than calling individual update methods because:
-        - Single lock acquisition per resource
+        - One lock acquisition for all resources, so readers of
+          get_all_resources_snapshot never see a half-applied batch
         - Single notification to observers
         - Reduces context switching
         
@@ -342,28 +476,25 @@ class DockerDataController(Subject):
         """
         updated_types = []
         
-        if containers is not None:
-            with self._containers_lock:
-                self._containers_cache = containers
-            updated_types.append(f"{len(containers)} containers")
-        
-        if networks is not None:
-            with self._networks_lock:
-                self._networks_cache = networks
-            updated_types.append(f"{len(networks)} networks")
-        
-        if images is not None:
-            with self._images_lock:
-                self._images_cache = images
-            updated_types.append(f"{len(images)} images")
-        
-        if volumes is not None:
-            with self._volumes_lock:
-                self._volumes_cache = volumes
-            updated_types.append(f"{len(volumes)} volumes")
+        with self._cache_lock:
+            if containers is not None:
+                self._set_containers(containers)
+                updated_types.append(f"{len(containers)} containers")
+            
+            if networks is not None:
+                self._set_networks(networks)
+                updated_types.append(f"{len(networks)} networks")
+            
+            if images is not None:
+                self._set_images(images)
+                updated_types.append(f"{len(images)} images")
+            
+            if volumes is not None:
+                self._set_volumes(volumes)
+                updated_types.append(f"{len(volumes)} volumes")
         
         if updated_types:
-            # Single notification for all updates
+            # Single notification for all updates, sent outside the lock
             self.notifyObservers(
                 'batch_updated',
                 data={
@@ -377,8 +508,8 @@ class DockerDataController(Subject):
     
     def find_container_by_id(self, container_id: str) -> Optional[Dict[str, Any]]:
         """
-        Fast container lookup using built-in next() with generator expression.
-        O(n) but more efficient than explicit loop due to early termination.
+        Container lookup by exact ID or name through the index; a short ID
+        prefix falls back to a scan of the indexed IDs.
         
         Args:
             container_id: Container ID (full or short)
@@ -386,16 +517,18 @@ class DockerDataController(Subject):
         Returns:
             Container dict or None
         """
-        with self._containers_lock:
-            return next(
-                (c for c in self._containers_cache 
-                 if c.get('id', '').startswith(container_id) or c.get('name') == container_id),
-                None
-            )
+        by_id, by_name, _ = self._containers_index
+        found = by_id.get(container_id) or by_name.get(container_id)
+        if found is not None or not container_id:
+            return found
+        return next(
+            (c for cid, c in by_id.items() if cid.startswith(container_id)),
+            None
+        )
     
     def find_containers_by_status(self, status: str) -> List[Dict[str, Any]]:
         """
-        Filter containers by status using list comprehension (faster than loop).
+        Containers with the given status, from the status index.
         
         Args:
             status: Container status (running, stopped, paused, etc.)
@@ -403,12 +536,11 @@ class DockerDataController(Subject):
         Returns:
             List of matching containers
         """
-        with self._containers_lock:
-            return [c for c in self._containers_cache if c.get('status') == status]
+        return list(self._containers_index[2].get(status, ()))
     
     def find_network_by_name(self, network_name: str) -> Optional[Dict[str, Any]]:
         """
-        Fast network lookup using generator expression.
+        Network lookup by name through the index.
         
         Args:
             network_name: Network name
@@ -416,15 +548,11 @@ class DockerDataController(Subject):
         Returns:
             Network dict or None
         """
-        with self._networks_lock:
-            return next(
-                (n for n in self._networks_cache if n.get('name') == network_name),
-                None
-            )
+        return self._networks_by_name.get(network_name)
     
     def find_image_by_tag(self, tag: str) -> Optional[Dict[str, Any]]:
         """
-        Fast image lookup by tag using generator expression.
+        Image lookup by tag through the index.
         
         Args:
             tag: Image tag (e.g., 'nginx:latest')
@@ -432,16 +560,11 @@ class DockerDataController(Subject):
         Returns:
             Image dict or None
         """
-        with self._images_lock:
-            return next(
-                (img for img in self._images_cache 
-                 if tag in img.get('repo_tags', [])),
-                None
-            )
+        return self._images_by_tag.get(tag)
     
     def find_volume_by_name(self, volume_name: str) -> Optional[Dict[str, Any]]:
         """
-        Fast volume lookup using generator expression.
+        Volume lookup by name through the index.
         
         Args:
             volume_name: Volume name
@@ -449,11 +572,7 @@ class DockerDataController(Subject):
         Returns:
             Volume dict or None
         """
-        with self._volumes_lock:
-            return next(
-                (v for v in self._volumes_cache if v.get('Name') == volume_name),
-                None
-            )
+        return self._volumes_by_name.get(volume_name)
     
     def get_resource_counts(self) -> Dict[str, int]:
         """
@@ -463,11 +582,13 @@ class DockerDataController(Subject):
         Returns:
             Dictionary with resource counts
         """
-        # Using len() is O(1) - no iteration needed
+        # Using len() is O(1) - no iteration needed; status counts come from the status index
+        containers = self._containers_cache
+        by_status = self._containers_index[2]
         return {
-            'total_containers': len(self._containers_cache),
-            'running_containers': sum(1 for c in self._containers_cache if c.get('status') == 'running'),
-            'stopped_containers': sum(1 for c in self._containers_cache if c.get('status') in ('exited', 'stopped')),
+            'total_containers': len(containers),
+            'running_containers': len(by_status.get('running', ())),
+            'stopped_containers': len(by_status.get('exited', ())) + len(by_status.get('stopped', ())),
             'total_networks': len(self._networks_cache),
             'total_images': len(self._images_cache),
             'total_volumes': len(self._volumes_cache),
@@ -476,8 +597,9 @@ class DockerDataController(Subject):
     
     def filter_containers_by_criteria(self, **criteria) -> List[Dict[str, Any]]:
         """
-        Filter containers using multiple criteria with efficient all() function.
-        Uses generator expression and all() to short-circuit on first False.
+        Filter containers using multiple criteria.
+        The callable check is done once per criterion rather than per container,
+        and an exact 'status' criterion starts from the status index.
         
         Example:
             filter_containers_by_criteria(status='running', cpu=lambda x: float(x) > 50)
@@ -490,15 +612,21 @@ class DockerDataController(Subject):
         Returns:
             Filtered container list
         """
-        with self._containers_lock:
-            def matches_criteria(container: Dict[str, Any]) -> bool:
-                return all(
-                    (callable(value) and value(container.get(key))) or 
-                    container.get(key) == value
-                    for key, value in criteria.items()
-                )
-            
-            return [c for c in self._containers_cache if matches_criteria(c)]
+        eq_items = [(key, value) for key, value in criteria.items() if not callable(value)]
+        pred_items = [(key, value) for key, value in criteria.items() if callable(value)]
+        
+        status = criteria.get('status')
+        if isinstance(status, str):
+            candidates = self._containers_index[2].get(status, ())
+            eq_items = [(key, value) for key, value in eq_items if key != 'status']
+        else:
+            candidates = self._containers_cache
+        
+        return [
+            c for c in candidates
+            if all(c.get(key) == value for key, value in eq_items)
+            and all(pred(c.get(key)) for key, pred in pred_items)
+        ]
     
     def bulk_notify_actions(self, actions: List[Dict[str, Any]]) -> None:
         """
@@ -528,11 +656,12 @@ class DockerDataController(Subject):
         Returns:
             Dictionary containing all cached data
         """
-        # Single lock acquisition per resource type
-        containers = self.get_containers()
-        networks = self.get_networks()
-        images = self.get_images()
-        volumes = self.get_volumes()
+        # Read all four under the writer lock for a consistent point-in-time view
+        with self._cache_lock:
+            containers = self._containers_cache
+            networks = self._networks_cache
+            images = self._images_cache
+            volumes = self._volumes_cache
         
         # Fast dict creation using dict literal
         return {
@@ -541,14 +670,48 @@ class DockerDataController(Subject):
             'images': images,
             'volumes': volumes,
             'timestamp': __import__('time').time(),
-            'stats': self.get_stats()
+            'stats': {
+                'containers': len(containers),
+                'networks': len(networks),
+                'images': len(images),
+                'volumes': len(volumes),
+                'observers': self.get_observer_count()
+            }
         }
     
+    def get_all_resources_snapshot_bytes(self) -> bytes:
+        """
+        Get get_all_resources_snapshot() serialized as UTF-8 JSON.
+        
+        The bytes are reused until any cache is republished or the observer count
+        changes, so repeated reads between updates skip serialization; the
+        timestamp is the time the bytes were built.
+        
+        Returns:
+            JSON-encoded snapshot
+        """
+        snapshot = self.get_all_resources_snapshot()
+        key = (
+            snapshot['containers'], snapshot['networks'], snapshot['images'],
+            snapshot['volumes'], snapshot['stats']['observers']
+        )
+        memo_key, memo = self._snapshot_bytes_memo
+        if memo_key is not None and all(a is b for a, b in zip(memo_key[:4], key[:4])) \
+                and memo_key[4] == key[4]:
+            return memo
+        
+        if orjson is not None:
+            data = orjson.dumps(snapshot, default=str)
+        else:
+            data = json.dumps(snapshot, default=str).encode('utf-8')
+        self._snapshot_bytes_memo = (key, data)
+        return data
+    
     def search_resources(self, query: str, 
                         search_types: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
         """
         Fast search across all resource types using case-insensitive matching.
-        Uses list comprehensions and any() for efficient searching.
+        Each query is one substring test per resource against a cached haystack.
         
         Args:
             query: Search string (case-insensitive)
@@ -562,47 +725,50 @@ class DockerDataController(Subject):
         search_types = search_types or ['containers', 'networks', 'images', 'volumes']
         results = {}
         
-        if 'containers' in search_types:
-            with self._containers_lock:
-                results['containers'] = [
-                    c for c in self._containers_cache
-                    if any(query_lower in str(v).lower() for v in c.values())
-                ]
-        
-        if 'networks' in search_types:
-            with self._networks_lock:
-                results['networks'] = [
-                    n for n in self._networks_cache
-                    if any(query_lower in str(v).lower() for v in n.values())
-                ]
-        
-        if 'images' in search_types:
-            with self._images_lock:
-                results['images'] = [
-                    img for img in self._images_cache
-                    if any(query_lower in str(v).lower() for v in img.values())
-                ]
-        
-        if 'volumes' in search_types:
-            with self._volumes_lock:
-                results['volumes'] = [
-                    v for v in self._volumes_cache
-                    if any(query_lower in str(val).lower() for val in v.values())
-                ]
+        for kind in ('containers', 'networks', 'images', 'volumes'):
+            if kind in search_types:
+                items, blobs = self._get_search_blobs(kind)
+                results[kind] = [item for item, blob in zip(items, blobs) if query_lower in blob]
         
         return results
     
+    def _get_search_blobs(self, kind: str) -> tuple:
+        """
+        Return (items, haystacks) for a resource type, rebuilding the haystacks
+        only when the cache list has been replaced since the last search.
+        """
+        items = getattr(self, f'_{kind}_cache')
+        cached = self._search_blobs.get(kind)
+        if cached is None or cached[0] is not items:
+            # NUL-separated so a query cannot match across two values
+            blobs = ['\0'.join(map(str, item.values())).lower() for item in items]
+            cached = (items, blobs)
+            self._search_blobs[kind] = cached
+        return cached
+    
     def compute_resource_metrics(self) -> Dict[str, Any]:
         """
         Compute metrics using efficient built-in functions and list comprehensions.
         Uses map(), filter(), and sum() for optimal performance.
         
+        The result is memoized per published containers list, so every widget
+        polling between two updates shares one computation.
+        
         Returns:
             Dictionary with computed metrics
         """
-        with self._containers_lock:
-            containers = self._containers_cache.copy()
+        containers = self._containers_cache
+        memo_source, memo = self._metrics_memo
+        if memo_source is containers:
+            return dict(memo)
         
+        metrics = self._compute_metrics(containers)
+        self._metrics_memo = (containers, metrics)
+        return dict(metrics)
+    
+    @classmethod
+    def _compute_metrics(cls, containers: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Compute the metrics of compute_resource_metrics for one containers list."""
         if not containers:
             return {
                 'avg_cpu': 0.0,
@@ -616,6 +782,19 @@ class DockerDataController(Subject):
         # Use list comprehension with filter for running containers
         running_containers = [c for c in containers if c.get('status') == 'running']
         
+        count = len(running_containers)
+        if np is not None and count >= cls.NUMPY_METRICS_MIN:
+            cpu = np.fromiter((float(c.get('cpu', 0)) for c in running_containers), dtype=np.float64, count=count)
+            ram = np.fromiter((float(c.get('ram', 0)) for c in running_containers), dtype=np.float64, count=count)
+            return {
+                'avg_cpu': float(cpu.mean()),
+                'avg_ram': float(ram.mean()),
+                'max_cpu': float(cpu.max()),
+                'max_ram': float(ram.max()),
+                'total_containers': len(containers),
+                'running_containers': count
+            }
+        
         # Use generator expressions with sum() for efficiency
         cpu_values = [float(c.get('cpu', 0)) for c in running_containers]
         ram_values = [float(c.get('ram', 0)) for c in running_containers]
@@ -630,8 +809,8 @@ class DockerDataController(Subject):
         }
 
 
-# Global singleton instance
-_controller = None
+# Global singleton instance, created once at import (the import lock serializes it)
+_controller = DockerDataController()
 
 
 def get_docker_controller() -> DockerDataController:
@@ -641,7 +820,4 @@ def get_docker_controller() -> DockerDataController:
     Returns:
         DockerDataController singleton instance
     """
-    global _controller
-    if _controller is None:
-        _controller = DockerDataController()
     return _controller
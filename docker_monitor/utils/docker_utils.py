@@ -44,7 +44,8 @@ manual_refresh_queue = queue.Queue()  # A dedicated queue for manual refresh res
 network_refresh_queue = queue.Queue(maxsize=5)
 logs_stream_queue = queue.Queue(maxsize=20)
 events_queue = queue.Queue(maxsize=50)
-docker_lock = threading.Lock()  # A lock to prevent race conditions on Docker operations
+docker_lock = threading.Lock()  # Serializes mutating Docker operations; read-only calls (list/get/stats) do not need it
+docker_sem = threading.BoundedSemaphore(10)  # Caps concurrent independent Docker calls (e.g. volume create/remove/get) without serializing them
 
 
 def _offer_latest(q: queue.Queue, item, queue_name: str) -> None:
@@ -87,6 +88,71 @@ def calculate_cpu_percent(stats):
     return 0.0
 
 
+# Last (container CPU total, system CPU total, monotonic time) seen per container.
+# One-shot stats carry no precpu sample, so CPU% is computed against the previous
+# poll. Each polling loop passes its own dict; this one is the default for the rest.
+_cpu_samples = {}
+# A stored sample is only replaced once it is this old (seconds), so polls that
+# land close together still measure CPU over a meaningful interval
+CPU_SAMPLE_MIN_INTERVAL = 1.0
+# Flipped off the first time the SDK or daemon rejects one-shot stats
+_ONE_SHOT_STATS = True
+
+
+def calculate_cpu_percent_delta(container_id, stats, samples=None):
+    """Calculate CPU usage percentage from a single stats sample and the previous one.
+
+    Args:
+        container_id: Full container ID, used as the key into samples
+        stats: One-shot stats sample
+        samples: Previous-sample dict owned by the calling poll loop (module default if None)
+    """
+    if samples is None:
+        samples = _cpu_samples
+    try:
+        cpu_total = stats['cpu_stats']['cpu_usage']['total_usage']
+        system_total = stats['cpu_stats']['system_cpu_usage']
+        num_cpus = stats['cpu_stats'].get('online_cpus', 1)
+    except (KeyError, TypeError):
+        return 0.0
+
+    now = time.monotonic()
+    previous = samples.get(container_id)
+    if previous is None or now - previous[2] >= CPU_SAMPLE_MIN_INTERVAL:
+        samples[container_id] = (cpu_total, system_total, now)
+    if previous is None:
+        return 0.0
+
+    cpu_delta = cpu_total - previous[0]
+    system_delta = system_total - previous[1]
+    if system_delta > 0 and cpu_delta > 0:
+        return (cpu_delta / system_delta) * num_cpus * 100.0
+    return 0.0
+
+
+def prune_cpu_samples(samples, containers):
+    """Drop stored CPU samples of containers that are no longer in a full listing."""
+    live_ids = {c.id for c in containers}
+    for container_id in [cid for cid in samples if cid not in live_ids]:
+        samples.pop(container_id, None)
+
+
+def read_container_stats(container):
+    """Fetch one stats sample, preferring the fast one-shot endpoint (Docker 20.10+).
+
+    Returns (stats, one_shot) so callers know which CPU% calculation applies.
+    """
+    global _ONE_SHOT_STATS
+    if _ONE_SHOT_STATS:
+        try:
+            return container.stats(stream=False, one_shot=True), True
+        except (TypeError, docker.errors.InvalidVersion) as e:
+            # Older SDK (no one_shot argument) or daemon API below 1.41
+            logging.debug(f"One-shot stats unavailable, using two-sample stats: {e}")
+            _ONE_SHOT_STATS = False
+    return container.stats(stream=False), False
+
+
 def calculate_ram_percent(stats):
     """Calculate RAM usage percentage from Docker stats."""
     try:
@@ -98,8 +164,12 @@ def calculate_ram_percent(stats):
     return 0.0
 
 
-def get_container_stats(container):
-    """Get stats for a single container with timeout protection."""
+def get_container_stats(container, cpu_samples=None):
+    """Get stats for a single container with timeout protection.
+
+    The returned 'id' is the container's 12-char short ID, ready for display.
+    cpu_samples is the caller's previous-sample dict (see calculate_cpu_percent_delta).
+    """
     if container is None:
         logging.warning("get_container_stats called with None container")
         return {
@@ -122,11 +192,10 @@ def get_container_stats(container):
                 'ram': '0.00'
             }
         
-        # Fetch stats with a timeout to prevent hanging
-        # Use stream=False for non-blocking single stat fetch
-        stats = container.stats(stream=False)
+        # One-shot stats return in ~100ms instead of waiting ~1s for a second sample
+        stats, one_shot = read_container_stats(container)
 
-        cpu = calculate_cpu_percent(stats)
+        cpu = calculate_cpu_percent_delta(container.id, stats, cpu_samples) if one_shot else calculate_cpu_percent(stats)
         ram = calculate_ram_percent(stats)
         return {
             'id': container.short_id,
@@ -137,6 +206,7 @@ def get_container_stats(container):
         }
     except docker.errors.NotFound:
         # Container was removed while we were fetching stats
+        (_cpu_samples if cpu_samples is None else cpu_samples).pop(getattr(container, 'id', None), None)
         logging.debug(f"Container {getattr(container, 'name', 'unknown')} not found (likely removed)")
         return None
     except Exception as e:
@@ -348,16 +418,18 @@ def monitor_thread():
     
     # Get the Docker controller instance
     controller = get_docker_controller()
+    # CPU baselines of this loop only, so other refresh paths don't shorten its interval
+    cpu_samples = {}
 
     while True:
         try:
-            with docker_lock:
-                all_containers = client.containers.list(all=True)
+            all_containers = client.containers.list(all=True)
+            prune_cpu_samples(cpu_samples, all_containers)
 
             container_stats_pairs = []
             stats_payload = []
             for container in all_containers:
-                stats = get_container_stats(container)
+                stats = get_container_stats(container, cpu_samples)
                 container_stats_pairs.append((container, stats))
                 if stats is not None:
                     stats_payload.append(stats)
@@ -432,6 +504,9 @@ def docker_events_listener():
     """
     Background thread that listens to Docker events in real-time.
     Triggers immediate updates when containers are created, started, stopped, or removed.
+
+    The GUI no longer starts this: ContainerManager.start_event_refresh() is its
+    single events consumer. Don't run both, or every event is swept twice.
     """
     logging.info("Docker events listener started")
     
@@ -444,6 +519,8 @@ def docker_events_listener():
     # Debounce rapid events to prevent overwhelming the system
     last_refresh_time = 0
     MIN_REFRESH_INTERVAL = 0.5  # Minimum 500ms between refreshes
+    # CPU baselines for event-triggered refreshes, separate from the monitor loop's
+    cpu_samples = {}
     
     try:
         for event in client.events(decode=True):
@@ -493,40 +570,40 @@ def docker_events_listener():
                 # Trigger an immediate refresh by fetching current stats for app containers only
                 # Use a timeout to prevent hanging
                 def _fetch_and_notify():
-                    with docker_lock:
-                        try:
-                            all_containers = client.containers.list(all=True)
+                    try:
+                        all_containers = client.containers.list(all=True)
+                        prune_cpu_samples(cpu_samples, all_containers)
                             
-                            # Use list comprehension with error handling - much faster than loop
-                            def safe_get_stats(c):
-                                try:
-                                    return get_container_stats(c)
-                                except docker.errors.NotFound:
-                                    logging.debug(f"Container disappeared before stats could be read: {getattr(c, 'name', 'unknown')}")
-                                    return None
-                                except Exception as e:
-                                    logging.debug(f"Error getting stats for {getattr(c, 'name', 'unknown')}: {e}")
-                                    return None
+                        # Use list comprehension with error handling - much faster than loop
+                        def safe_get_stats(c):
+                            try:
+                                return get_container_stats(c, cpu_samples)
+                            except docker.errors.NotFound:
+                                logging.debug(f"Container disappeared before stats could be read: {getattr(c, 'name', 'unknown')}")
+                                return None
+                            except Exception as e:
+                                logging.debug(f"Error getting stats for {getattr(c, 'name', 'unknown')}: {e}")
+                                return None
                             
-                            stats_list = [s for s in (safe_get_stats(c) for c in all_containers) if s is not None]
+                        stats_list = [s for s in (safe_get_stats(c) for c in all_containers) if s is not None]
 
-                            # Notify controller with updated container data (Observer pattern)
-                            controller.update_containers(stats_list)
+                        # Notify controller with updated container data (Observer pattern)
+                        controller.update_containers(stats_list)
                             
-                            # Also put in queue for backward compatibility
-                            _offer_latest(stats_queue, stats_list, "stats")
-                            _offer_latest(manual_refresh_queue, stats_list, "manual refresh")
-
-                            # If the container was destroyed, do NOT run automatic cleanup.
-                            # Cleanup/prune should be triggered explicitly by the user.
-
-                        except docker.errors.NotFound as e:
-                            # This can happen if a specific container referenced in the
-                            # SDK query was removed concurrently. Treat as debug-worthy
-                            # rather than an error to avoid alarming logs for races.
-                            logging.debug(f"NotFound while processing event {event_action}: {e}")
-                        except Exception as e:
-                            logging.error(f"Error processing event {event_action}: {e}")
+                        # Also put in queue for backward compatibility
+                        _offer_latest(stats_queue, stats_list, "stats")
+                        _offer_latest(manual_refresh_queue, stats_list, "manual refresh")
+
+                        # If the container was destroyed, do NOT run automatic cleanup.
+                        # Cleanup/prune should be triggered explicitly by the user.
+
+                    except docker.errors.NotFound as e:
+                        # This can happen if a specific container referenced in the
+                        # SDK query was removed concurrently. Treat as debug-worthy
+                        # rather than an error to avoid alarming logs for races.
+                        logging.debug(f"NotFound while processing event {event_action}: {e}")
+                    except Exception as e:
+                        logging.error(f"Error processing event {event_action}: {e}")
                 
                 # Execute fetch in a separate thread to avoid blocking the event stream
                 from docker_monitor.utils.worker import run_in_thread
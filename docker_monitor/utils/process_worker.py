@@ -13,8 +13,9 @@ from __future__ import annotations
 
 import concurrent.futures
 import subprocess
+import threading
 import logging
-from typing import Callable, List, Optional, Dict
+from typing import Callable, Optional, Dict, Sequence
 
 # Tunable: number of parallel processes for heavy operations. Keep small to
 # avoid overwhelming network / disk IO. Can be changed later or made
@@ -24,6 +25,14 @@ DEFAULT_MAX_WORKERS = 2
 # A single ProcessPoolExecutor for the application lifetime.
 _executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
 
+# Cap on distinct docker commands in flight at once via run_docker_cmd_once;
+# dockerd degrades with many concurrent pulls/prunes.
+MAX_INFLIGHT_COMMANDS = 10
+
+_inflight: set = set()
+_inflight_lock = threading.Lock()
+_inflight_slots = threading.BoundedSemaphore(MAX_INFLIGHT_COMMANDS)
+
 
 def _get_executor() -> concurrent.futures.ProcessPoolExecutor:
     global _executor
@@ -32,7 +41,7 @@ def _get_executor() -> concurrent.futures.ProcessPoolExecutor:
     return _executor
 
 
-def _run_cmd(cmd: List[str]) -> Dict[str, object]:
+def _run_cmd(cmd: Sequence[str]) -> Dict[str, object]:
     """Top-level worker function executed in a separate process.
 
     Returns a dict with keys: returncode, stdout_tail, stderr_tail
@@ -56,12 +65,12 @@ def _run_cmd(cmd: List[str]) -> Dict[str, object]:
         }
 
 
-def run_docker_cmd_in_process(cmd: List[str], *, on_done: Optional[Callable[[Dict[str, object]], None]] = None,
+def run_docker_cmd_in_process(cmd: Sequence[str], *, on_done: Optional[Callable[[Dict[str, object]], None]] = None,
                               on_error: Optional[Callable[[Exception], None]] = None,
                               tk_root=None, block: bool = False) -> concurrent.futures.Future:
     """Submit a docker CLI command (or any command) to the process pool.
 
-    - cmd: list of command parts, e.g. ['docker','pull','nginx:alpine']
+    - cmd: list or tuple of command parts, e.g. ['docker','pull','nginx:alpine']
     - on_done(result): called when the command completes with the result dict
     - on_error(exc): called if submitting/running the job fails
     - tk_root: optional tkinter root/widget; if provided, callbacks will be
@@ -124,3 +133,44 @@ def run_docker_cmd_in_process(cmd: List[str], *, on_done: Optional[Callable[[Dic
             pass
 
     return fut
+
+
+def run_docker_cmd_once(cmd: Sequence[str], *, on_done: Optional[Callable[[Dict[str, object]], None]] = None,
+                        on_error: Optional[Callable[[Exception], None]] = None,
+                        tk_root=None, block: bool = False) -> Optional[concurrent.futures.Future]:
+    """Like run_docker_cmd_in_process, but skip commands that are already running.
+
+    An identical command still in flight (e.g. a double-clicked prune) is not
+    started again, and at most MAX_INFLIGHT_COMMANDS run at once. Returns None
+    when the command was skipped.
+    """
+    # Constant tuples (e.g. PruneManager._CMDS) are used as the key as-is
+    key = cmd if isinstance(cmd, tuple) else tuple(cmd)
+    with _inflight_lock:
+        if key in _inflight:
+            logging.info(f"Skipping duplicate command, already running: {' '.join(cmd)}")
+            return None
+        if not _inflight_slots.acquire(blocking=False):
+            logging.warning(f"Too many docker commands in flight, not starting: {' '.join(cmd)}")
+            return None
+        _inflight.add(key)
+
+    def _release(_f=None):
+        with _inflight_lock:
+            _inflight.discard(key)
+        _inflight_slots.release()
+
+    try:
+        fut = run_docker_cmd_in_process(cmd, on_done=on_done, on_error=on_error, tk_root=tk_root, block=False)
+    except Exception:
+        _release()
+        raise
+    fut.add_done_callback(_release)
+
+    if block:
+        try:
+            fut.result()
+        except Exception:
+            pass
+
+    return fut
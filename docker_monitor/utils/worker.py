@@ -1,5 +1,7 @@
 import concurrent.futures
+import queue
 import threading
+import time
 import logging
 
 # Shared ThreadPoolExecutor for I/O-bound tasks (Docker SDK calls)
@@ -101,3 +103,69 @@ def run_in_thread(fn, on_done=None, on_error=None, tk_root=None, block=False):
         if on_error:
             _schedule_callback(tk_root, on_error, e)
         return None
+
+
+class DockerWorker:
+    """Single thread that executes mutating Docker operations in submission order.
+
+    Because this thread is the only one issuing these calls, they need no lock;
+    callers get a Future instead of contending on ``docker_lock``. Requests that
+    arrive within BATCH_WINDOW of each other are drained and run back to back.
+    Read-only calls should not go through here; the SDK client is safe to use
+    concurrently for reads.
+    """
+
+    BATCH_WINDOW = 0.005
+
+    _queue = queue.Queue()
+    _thread = None
+    _start_lock = threading.Lock()
+
+    @classmethod
+    def submit(cls, fn, on_done=None, on_error=None):
+        """Queue fn() for the worker thread and return its Future.
+
+        - on_done(result) / on_error(exception) run on the worker thread.
+        """
+        cls._ensure_started()
+        fut = concurrent.futures.Future()
+        cls._queue.put((fn, fut, on_done, on_error))
+        return fut
+
+    @classmethod
+    def _ensure_started(cls):
+        if cls._thread is not None:
+            return
+        with cls._start_lock:
+            if cls._thread is None:
+                cls._thread = threading.Thread(target=cls._run, name='docker-worker', daemon=True)
+                cls._thread.start()
+
+    @classmethod
+    def _run(cls):
+        while True:
+            batch = [cls._queue.get()]
+            deadline = time.monotonic() + cls.BATCH_WINDOW
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(cls._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            for fn, fut, on_done, on_error in batch:
+                if not fut.set_running_or_notify_cancel():
+                    continue
+                try:
+                    result = fn()
+                except Exception as e:
+                    logging.exception('Error in Docker worker task')
+                    fut.set_exception(e)
+                    if on_error:
+                        _schedule_callback(None, on_error, e)
+                    continue
+                fut.set_result(result)
+                if on_done:
+                    _schedule_callback(None, on_done, result)